@@ -47,28 +47,209 @@
 # Import any python libraries needed to do the conversion work
 import math as m
 import os
+import re
 import json
-from pint import UnitRegistry
-from pint.errors import DimensionalityError
-from pint.errors import UndefinedUnitError
+import time
+import hashlib
+import json_loader
+from functools import lru_cache
+import numpy as np
+from measurement import Measurement
 
-# Create the unit registry object that can be used to easily convert units.
-ur = UnitRegistry()
+# The pint unit registry object that can be used to easily convert units. Building the registry
+# is by far the slowest part of importing this library, so it is only created (by Get_Unit_Registry)
+# the first time a unit is seen that is not in the precompiled conversion table below.
+ur = None
 
-# Open and read the TRC specific Units conversion file
+# The TRC specific Units conversion file loaded into the unit registry
 TRC_units_conversion_file = os.path.dirname(os.path.realpath(__file__))+"/TRC_units_conversion.txt"
-ur.load_definitions(TRC_units_conversion_file)
 
 # This line is required so that the calling C++ program can know that the "Python" interpreter is to be used
 rules_engine_language = "Python"
 
 # Accessing the units can be done in variable assignment like
+# ur = Get_Unit_Registry()
 # x = 2.54*ur.cm
 # Conversion can be done like so:
 # x = x.to(ur.inches)
 # Or it can automatically be done in place:
 # x.ito(ur.inches)
 
+# The precompiled conversion table holds the conversion plans for every unit seen in the TRC data
+# so that pint is not needed for them. It is generated by build_conversion_table.py and is only
+# used if it was built from the current TRC_units_conversion.txt file.
+conversion_table_json_file = os.path.dirname(os.path.realpath(__file__))+"/conversion_table.json"
+
+# The UnitsStandard table maps each database property symbol to its database units. It is loaded
+# the first time it is needed and then shared by every conversion (and by the ValidationLibrary)
+# instead of being read from disk for every value. The files are checked for changes at most once
+# every units_standard_check_interval seconds and the table is reloaded if the file has changed.
+# If UnitsStandard.json does not exist (or can not be parsed) the UnitsStandard section of
+# decoder_table.json is used instead.
+units_standard_json_file = os.path.dirname(os.path.realpath(__file__))+"/UnitsStandard.json"
+decoder_table_json_file = os.path.dirname(os.path.realpath(__file__))+"/decoder_table.json"
+units_standard_check_interval = 1.0
+units_standard_table = None
+units_standard_source = None
+units_standard_mtime = None
+units_standard_checked = None
+
+# Maximum number of unit conversion plans kept in the conversion plan cache
+conversion_plan_cache_size = 1024
+
+# Creates the pint unit registry (with the TRC specific units) the first time it is needed
+# and returns it. Since it's only called internally, we don't need the parameter definition.
+def Get_Unit_Registry():
+    global ur
+    if ur is None:
+        from pint import UnitRegistry
+        ur = UnitRegistry()
+        ur.load_definitions(TRC_units_conversion_file)
+    return ur
+
+# Returns the hash of the TRC_units_conversion.txt file which the precompiled conversion table was built from
+# Since it's only called internally, we don't need the parameter definition.
+def Get_Units_Conversion_Hash():
+    with open(TRC_units_conversion_file,'rb') as units_conversion_handle:
+        return hashlib.sha256(units_conversion_handle.read()).hexdigest()
+
+# Loads the precompiled conversion table into a dict of (original_units, units, prop_sym) -> plan.
+# If the table is missing or was built from a different TRC_units_conversion.txt, an empty table
+# is returned and every conversion is done with pint. Since it's only called internally, we don't
+# need the parameter definition.
+def Load_Conversion_Table():
+    try:
+        conversion_table_json = json_loader.load_file(conversion_table_json_file)
+        if conversion_table_json['units_conversion_hash'] != Get_Units_Conversion_Hash():
+            return {}
+        return {(p[0],p[1],p[2]): [p[3],p[4],p[5],p[6]] for p in conversion_table_json['plans']}
+    except (OSError, json.JSONDecodeError, KeyError, IndexError):
+        return {}
+
+# Load the precompiled conversion table
+precompiled_conversion_table = Load_Conversion_Table()
+
+# Conversion telemetry. Every conversion is counted by the branch of its conversion plan (i.e.
+# 'manual W/m/K', 'pint direct', 'underscore retry' or 'pass-through') along with the time spent
+# in each branch, and failed conversions are counted per (prop_sym, original_units) with the error
+# that caused them. It is only kept in memory so there is no I/O while converting. Read it with
+# Get_Conversion_Telemetry() or write it out at the end of a run with Dump_Conversion_Telemetry(file).
+conversion_calls = {}
+conversion_time = {}
+conversion_failures = {}
+conversion_errors = {}
+
+# Counts count conversions done by branch since the time start. Since it's only called internally,
+# we don't need the parameter definition.
+def Record_Conversion(branch, start, count=1):
+    conversion_calls[branch] = conversion_calls.get(branch, 0) + count
+    conversion_time[branch] = conversion_time.get(branch, 0.0) + time.perf_counter() - start
+
+# Counts count failed conversions of original_units for the property prop_sym. Since it's only
+# called internally, we don't need the parameter definition.
+def Record_Conversion_Failure(prop_sym, original_units, count=1):
+    conversion_failures[(prop_sym, original_units)] = conversion_failures.get((prop_sym, original_units), 0) + count
+
+# Returns the conversion telemetry as a dict that can be written as JSON.
+# Since it's only called internally, we don't need the parameter definition.
+def Get_Conversion_Telemetry():
+    return {
+        'calls': dict(conversion_calls),
+        'time': dict(conversion_time),
+        'failures': [{'prop_sym': k[0], 'original_units': k[1], 'count': v, 'error': conversion_errors.get(k, '')} for k, v in conversion_failures.items()],
+        'plan_cache': Conversion_Plan_Cache_Info(),
+    }
+
+# Writes the conversion telemetry to a JSON file. Since it's only called internally,
+# we don't need the parameter definition.
+def Dump_Conversion_Telemetry(file):
+    with open(file,'w') as fp:
+        json.dump(Get_Conversion_Telemetry(), fp, indent=4)
+
+# Clears the conversion telemetry. Since it's only called internally, we don't need the parameter definition.
+def Reset_Conversion_Telemetry():
+    conversion_calls.clear()
+    conversion_time.clear()
+    conversion_failures.clear()
+
+# Returns the hit and miss statistics of the conversion plan cache as a dict.
+# Since it's only called internally, we don't need the parameter definition.
+def Conversion_Plan_Cache_Info():
+    cache_info = Compile_Conversion_Plan.cache_info()
+    return {'hits': cache_info.hits, 'misses': cache_info.misses, 'maxsize': cache_info.maxsize, 'currsize': cache_info.currsize}
+
+# Empties the conversion plan cache and resets its statistics. Since it's only called internally,
+# we don't need the parameter definition.
+def Clear_Conversion_Plan_Cache():
+    Compile_Conversion_Plan.cache_clear()
+
+# Returns the UnitsStandard table as a dict of property symbol -> database units.
+# Since it's only called internally, we don't need the parameter definition.
+def Get_Units_Standard():
+    global units_standard_table, units_standard_source, units_standard_mtime, units_standard_checked
+
+    now = time.monotonic()
+    if units_standard_table is not None and now - units_standard_checked < units_standard_check_interval:
+        return units_standard_table
+    units_standard_checked = now
+
+    # Use UnitsStandard.json if it exists, otherwise use the decoder_table.json
+    for source in [units_standard_json_file, decoder_table_json_file]:
+        try:
+            mtime = os.stat(source).st_mtime_ns
+        except OSError:
+            continue
+        # The file has not changed since it was last loaded so keep using the table
+        if source == units_standard_source and mtime == units_standard_mtime:
+            return units_standard_table
+        try:
+            units_standard_json = json_loader.load_file(source)
+            if source == decoder_table_json_file:
+                units_standard_json = units_standard_json['UnitsStandard']
+        except (OSError, json.JSONDecodeError, KeyError):
+            continue
+        units_standard_table = units_standard_json
+        units_standard_source = source
+        units_standard_mtime = mtime
+        return units_standard_table
+
+    # Neither file could be read so there are no database units to convert to
+    units_standard_table = {}
+    units_standard_source = None
+    units_standard_mtime = None
+    return units_standard_table
+
+# Returns [value, uncertainty, units, name] of a numeric input. The input can either be a Measurement
+# (whose fields are used directly) or the tuple passed by the C++ program, in which case the
+# "value,uncertainty" string in the 4th position is parsed. Since it's only called internally,
+# we don't need the parameter definition.
+def Read_Value(tuple0):
+    if type(tuple0) is Measurement:
+        return [tuple0.value, tuple0.uncertainty, tuple0.units, tuple0.prop]
+    float_value_list = tuple0[3].split(',')
+    return [float(float_value_list[0]), float(float_value_list[1]), tuple0[6], tuple0[5]]
+
+# Temperature conversion engine
+# Every temperature unit is an affine function of Kelvin: K = value*scale + shift.
+temperature_to_kelvin = {'K': (1, 0), 'C': (1, 273.15), 'F': (5/9, 273.15-32*(5/9)), 'R': (5/9, 0)}
+
+# So converting from any temperature unit to any other is a single affine step
+# new_value = value*factor + offset (and new_uncertainty = uncertainty*factor).
+# This dict holds (factor, offset) for every (original_units, new_units) pair.
+temperature_conversions = {
+    (original_units, new_units): (original_scale/new_scale, (original_shift-new_shift)/new_scale)
+    for original_units, (original_scale, original_shift) in temperature_to_kelvin.items()
+    for new_units, (new_scale, new_shift) in temperature_to_kelvin.items()
+}
+
+# Converts a temperature (and its uncertainty) between any of K, C, F and R in one step.
+# The value and uncertainty can be floats or NumPy arrays (for whole temperature columns).
+# Returns a list of [converted_value, converted_uncertainty]. Raises a KeyError for units
+# that are not K, C, F or R. Since it's only called internally, we don't need the parameter definition.
+def Convert_Temperature(value, uncertainty, original_units, new_units):
+    factor, offset = temperature_conversions[(original_units, new_units)]
+    return [value*factor+offset, uncertainty*factor]
+
 # Temperature conversion from C to K function
 # the temperature value should be a float. If empty or not a number return -999
 # Remember that all numeric input values are really strings that contain the numeric value 
@@ -78,14 +259,11 @@ def Temperature_CtoK(tuple0):
     # parameter definition (temperature: double)
 
     # Convert the 4th position of the parameter tuple to a temperature float value. Note tuples indices start at 0
-    float_value_list = tuple0[3].split(',')
-    temperature = float(float_value_list[0])
-    uncertainty = float(float_value_list[1])
+    temperature, uncertainty, temperature_units, value_name = Read_Value(tuple0)
     #print(temperature)
     #print(uncertainty)
 
     # If the units of the temperature is NOT "C" then return -999 as this is a C to K conversion routine!
-    temperature_units = tuple0[6]
     #print(temperature_units)
     if temperature_units is None or temperature_units != "C":
         return ["double",-999,uncertainty,"K","temperature"]
@@ -108,14 +286,11 @@ def Temperature_FtoK(tuple0):
     # parameter definition (temperature: double)
 
     # Convert the 4th position of the parameter tuple to a temperature float value. Note tuples indices start at 0
-    float_value_list = tuple0[3].split(',')
-    temperature = float(float_value_list[0])
-    uncertainty = float(float_value_list[1])
+    temperature, uncertainty, temperature_units, value_name = Read_Value(tuple0)
     #print(temperature)
     #print(uncertainty)
 
     # If the units of the temperature is NOT "F" then return -999 as this is a F to K conversion routine!
-    temperature_units = tuple0[6]
     #print(temperature_units)
     if temperature_units is None or temperature_units != "F":
         return ["double",-999,uncertainty,"K","temperature"]
@@ -136,14 +311,11 @@ def Temperature_RtoK(tuple0):
     # parameter definition (temperature: double)
 
     # Convert the 4th position of the parameter tuple to a temperature float value. Note tuples indices start at 0
-    float_value_list = tuple0[3].split(',')
-    temperature = float(float_value_list[0])
-    uncertainty = float(float_value_list[1])
+    temperature, uncertainty, temperature_units, value_name = Read_Value(tuple0)
     #print(temperature)
     #print(uncertainty)
 
     # If the units of the temperature is NOT "R" then return -999 as this is a R to K conversion routine!
-    temperature_units = tuple0[6]
     #print(temperature_units)
     if temperature_units is None or temperature_units != "R":
         return ["double",-999,uncertainty,"K","temperature"]
@@ -164,15 +336,12 @@ def Temperature_KtoC(tuple0):
     # parameter definition (temperature: double)
 
     # Convert the 4th position of the parameter tuple to a temperature float value. Note tuples indices start at 0
-    float_value_list = tuple0[3].split(',')
-    temperature = float(float_value_list[0])
-    uncertainty = float(float_value_list[1])
-    print(temperature)
-    print(uncertainty)
+    temperature, uncertainty, temperature_units, value_name = Read_Value(tuple0)
+    #print(temperature)
+    #print(uncertainty)
 
     # If the units of the temperature is NOT "K" then return -999 as this is a K to C conversion routine!
-    temperature_units = tuple0[6]
-    print(temperature_units)
+    #print(temperature_units)
     if temperature_units is None or temperature_units != "K":
         return ["double",-999,uncertainty,"C","temperature"]
 
@@ -194,15 +363,12 @@ def Temperature_KtoF(tuple0):
     # parameter definition (temperature: double)
 
     # Convert the 4th position of the parameter tuple to a temperature float value. Note tuples indices start at 0
-    float_value_list = tuple0[3].split(',')
-    temperature = float(float_value_list[0])
-    uncertainty = float(float_value_list[1])
-    print(temperature)
-    print(uncertainty)
+    temperature, uncertainty, temperature_units, value_name = Read_Value(tuple0)
+    #print(temperature)
+    #print(uncertainty)
 
     # If the units of the temperature is NOT "K" then return -999 as this is a K to F conversion routine!
-    temperature_units = tuple0[6]
-    print(temperature_units)
+    #print(temperature_units)
     if temperature_units is None or temperature_units != "K":
         return ["double",-999,uncertainty,"F","temperature"]
 
@@ -222,15 +388,12 @@ def Temperature_KtoR(tuple0):
     # parameter definition (temperature: double)
 
     # Convert the 4th position of the parameter tuple to a temperature float value. Note tuples indices start at 0
-    float_value_list = tuple0[3].split(',')
-    temperature = float(float_value_list[0])
-    uncertainty = float(float_value_list[1])
-    print(temperature)
-    print(uncertainty)
+    temperature, uncertainty, temperature_units, value_name = Read_Value(tuple0)
+    #print(temperature)
+    #print(uncertainty)
 
     # If the units of the temperature is NOT "K" then return -999 as this is a K to R conversion routine!
-    temperature_units = tuple0[6]
-    print(temperature_units)
+    #print(temperature_units)
     if temperature_units is None or temperature_units != "K":
         return ["double",-999,uncertainty,"R","temperature"]
 
@@ -246,6 +409,12 @@ def Temperature_KtoR(tuple0):
 def Into_SI_Units(tuple0):
     # parameter definition (value: double)
 
+    # Temperatures are converted straight to Kelvin with the temperature engine
+    original_value, original_uncertainty, original_units, value_name = Read_Value(tuple0)
+    if original_units in temperature_to_kelvin:
+        converted = Convert_Temperature(original_value, original_uncertainty, original_units, 'K')
+        return ['double', converted[0], converted[1], 'K', value_name]
+
     return Into_DB_Units(tuple0)
 
     value_input = tuple0[3].split(',')
@@ -314,14 +483,12 @@ def Into_SI_Units(tuple0):
 def Into_DB_Units(tuple0):
     # parameter definition (value: double)
 
-    value_input = tuple0[3].split(',')
-    value_name = tuple0[5] # the value_name is the property symbol
-    original_units = tuple0[6]
-    original_value = float(value_input[0])
-    original_uncertainty = float(value_input[1])
+    # the value_name is the property symbol
+    original_value, original_uncertainty, original_units, value_name = Read_Value(tuple0)
     # If the original_units is S (keep the units as they are in the correct units) or D (unknown)
     # just return the input values
     if original_units == 'S' or original_units == 'D' or original_units == 'Unknown':
+        conversion_calls['pass-through'] = conversion_calls.get('pass-through', 0) + 1
         return ['double',original_value,original_uncertainty,original_units,value_name]
 
     converted_list = Convert_To_DB_Units(original_value, original_uncertainty, original_units, value_name)
@@ -345,53 +512,132 @@ def Into_Desired_Units(tuple0, tuple1):
     # parameter definition (value: double, units: string)
     
     #Note: This function will generally not work for temperature conversions.
-    value_input = tuple0[3].split(',')
-    value_name = tuple0[5]
-    original_units = tuple0[6]
-    original_value = float(value_input[0])
-    original_uncertainty = float(value_input[1])
+    original_value, original_uncertainty, original_units, value_name = Read_Value(tuple0)
     # Note: the new units may be at the 4th index depending on whether you pass it
     # in the string location or in the units location. I assumed they would be
-    # in the string location.
-    new_units = tuple1[4]
-    converted_value = (original_value*ur[original_units]).to(new_units).magnitude
-    converted_uncertainty = (original_uncertainty*ur[original_units]).to(new_units).magnitude
+    # in the string location. The new units can also just be passed as a string.
+    new_units = tuple1 if isinstance(tuple1, str) else tuple1[4]
+    start = time.perf_counter()
+    factor, offset, new_units, branch = Compile_Conversion_Plan(original_units, new_units, None)
+    converted_value = original_value*factor+offset
+    converted_uncertainty = original_uncertainty*factor
+    Record_Conversion(branch, start)
     return ['double', converted_value, converted_uncertainty, new_units, value_name]
 
+# Takes an array of values and an array of uncertainties that all share the same original_units
+# and converts the whole array into new_units, i.e. the units a user wants the data displayed in.
+# Unlike Into_Desired_Units this also handles the temperature units K, C, F and R.
+# Returns a list of [converted_values, converted_uncertainties, new_units].
+# Since it's only called internally, we don't need the parameter definition.
+def Convert_Units_Array(values, uncertainties, original_units, new_units):
+    values = np.asarray(values, dtype=float)
+    uncertainties = np.broadcast_to(np.asarray(uncertainties, dtype=float), values.shape)
+    start = time.perf_counter()
+    if original_units == new_units:
+        factor, offset, branch = 1, 0, 'pass-through'
+    elif (original_units in temperature_to_kelvin) and (new_units in temperature_to_kelvin):
+        factor, offset = temperature_conversions[(original_units, new_units)]
+        branch = 'temperature'
+    else:
+        factor, offset, new_units, branch = Compile_Conversion_Plan(original_units, new_units, None)
+    converted = [values*factor+offset,uncertainties*factor,new_units]
+    Record_Conversion(branch, start, values.size)
+    return converted
+
 # Takes a value from Python and converts it into database units.
 # Since it's only called internally, we don't need the parameter definition.
 # prop_sym is the database property symbol.
 def Convert_To_DB_Units(value, uncertainty, original_units, prop_sym):
+    # Every database unit conversion is affine (value*factor+offset), so resolve the
+    # factor and offset for these units once and then just apply them to the value.
+    # The offset only applies to the value since the uncertainty is a difference.
+    # A missing value or uncertainty (None) stays None.
+    start = time.perf_counter()
+    factor, offset, units, branch = Resolve_DB_Conversion(original_units, prop_sym)
+    if branch == 'failed':
+        Record_Conversion_Failure(prop_sym, original_units)
+    if factor is None:
+        converted = [None,None,units]
+    else:
+        converted = [None if value is None else value*factor+offset,None if uncertainty is None else uncertainty*factor,units]
+    Record_Conversion(branch, start)
+    return converted
+
+# Takes an array of values and an array of uncertainties that all share the same
+# original_units and prop_sym and converts the whole array into database units in one shot.
+# The conversion is only resolved once for the array rather than once per value.
+# Values and uncertainties may be any array-like (lists, NumPy arrays, pandas columns);
+# missing values (None) become NaN where the scalar path leaves them None.
+# Since it's only called internally, we don't need the parameter definition.
+def Convert_To_DB_Units_Array(values, uncertainties, original_units, prop_sym):
+    values = np.asarray(values, dtype=float)
+    uncertainties = np.broadcast_to(np.asarray(uncertainties, dtype=float), values.shape)
+    start = time.perf_counter()
+    factor, offset, units, branch = Resolve_DB_Conversion(original_units, prop_sym)
+    if branch == 'failed':
+        Record_Conversion_Failure(prop_sym, original_units, values.size)
+    if factor is None:
+        converted = [np.full(values.shape, np.nan),np.full(values.shape, np.nan),units]
+    else:
+        converted = [values*factor+offset,uncertainties*factor,units]
+    Record_Conversion(branch, start, values.size)
+    return converted
+
+# Finds the conversion from original_units into database units for the property prop_sym.
+# Returns a list of [factor, offset, units, branch] where the converted value is value*factor+offset,
+# the converted uncertainty is uncertainty*factor, units are the database units and branch names
+# the conversion path. If the value can not be converted (i.e. a dimensionless value for a property
+# with units) then [None, None, 'None', 'not convertible'] is returned.
+# Since it's only called internally, we don't need the parameter definition.
+def Resolve_DB_Conversion(original_units, prop_sym):
+    return Compile_Conversion_Plan(original_units, Get_DB_Units(original_units, prop_sym), prop_sym)
+
+# Returns the database units that original_units of the property prop_sym are converted into.
+# Since it's only called internally, we don't need the parameter definition.
+def Get_DB_Units(original_units, prop_sym):
     # Define the units to be the original units first
     units = original_units
     
-    # Load the UnitsStandard.json and UnitsSpecial.json files in to JSON objects
-    try:
-        units_standard_json_file = os.path.dirname(os.path.realpath(__file__))+"/UnitsStandard.json"
-        units_standard_handle = open(units_standard_json_file,'r')
-        units_standard_data=units_standard_handle.read()
-    
-        # Now parse the data into JSON objects
-        try:
-            units_standard_json = json.loads(units_standard_data)
+    # Get the (cached) UnitsStandard table and look up the database units for the property
+    units_standard_json = Get_Units_Standard()
 
-            # Now need to do a try block to catch any cases where the prop_sym is NOT in the json
-            try:
-                units = units_standard_json[prop_sym.upper()]
-            except KeyError:
-                if original_units == 'C' or original_units == 'K' or original_units == 'F' or original_units == 'R':
-                    units = ''
-        except json.JSONDecodeError:
-            if original_units == 'C' or original_units == 'K' or original_units == 'F' or original_units == 'R':
-                units = ''
-
-    except OSError as err:
+    # Now need to do a try block to catch any cases where the prop_sym is NOT in the json
+    try:
+        units = units_standard_json[prop_sym.upper()]
+        # Dimensionless properties have empty database units which are passed around as 'None'
+        if units == '':
+            units = 'None'
+    except KeyError:
         if original_units == 'C' or original_units == 'K' or original_units == 'F' or original_units == 'R':
             units = ''
 
+    return units
+
+# Returns the conversion plan [factor, offset, units, branch] that converts original_units into units.
+# The branch names the path that resolved the plan (i.e. 'pint direct' or 'manual W/m/K') for the telemetry.
+# If prop_sym is given, units are the database units of that property and all of the special
+# case database conversions are applied. If prop_sym is None it is a plain pint conversion.
+# The set of distinct unit pairs is tiny compared to the number of values, so the plans are kept
+# in an LRU cache and pint is only used the first time a unit pair is seen.
+# Use Conversion_Plan_Cache_Info() to get the cache hit and miss statistics.
+# Since it's only called internally, we don't need the parameter definition.
+@lru_cache(maxsize=conversion_plan_cache_size)
+def Compile_Conversion_Plan(original_units, units, prop_sym):
+    # Use the precompiled plan if there is one so pint is not needed
+    plan = precompiled_conversion_table.get((original_units, units, prop_sym))
+    if plan is not None:
+        return plan
+    error_key = (prop_sym, original_units)
+
+    # Plain unit conversion, i.e. for Into_Desired_Units. Any pint errors are raised to the caller.
+    if prop_sym is None:
+        ur = Get_Unit_Registry()
+        offset = (0*ur[original_units]).to(units).magnitude
+        return [(1*ur[original_units]).to(units).magnitude-offset,offset,units,'pint direct']
+
     # If the units are already in DB units, we don't need to convert.
     if original_units == units:
-        return [value,uncertainty,original_units]
+        return [1,0,original_units,'pass-through']
     else:
         # Special case conversions
         # Manually define the conversions
@@ -399,14 +645,8 @@ def Convert_To_DB_Units(value, uncertainty, original_units, prop_sym):
         # We have to do temperature unit conversions manually because pint
         # does not handle conversions with shifts.
         # If the unit is just temperature, we just perform the conversion to Kelvin.
-        if original_units == 'C':
-            return [value+273.15,uncertainty,'K']
-        elif original_units == 'F':
-            return [(value-32)*(5/9)+273.15,uncertainty*(5/9),'K']
-        elif original_units == 'K':
-            return [value,uncertainty,'K']
-        elif original_units == 'R':
-            return [value*(5/9),uncertainty*(5/9),'K']
+        if original_units in temperature_to_kelvin:
+            return [*temperature_conversions[(original_units,'K')],'K','temperature']
         
         # Since units W/m/K may have multiple conversions (i.e. from cal/cm/S/K and btu/ft/hr/F)
         # and pint only allows one conversion must do the second conversion manually here
@@ -414,51 +654,51 @@ def Convert_To_DB_Units(value, uncertainty, original_units, prop_sym):
             #print('original_units: '+original_units)
             #print('units: '+units)
             if original_units.find('calorie/cm/S/K') != -1:
-                return [value*419,uncertainty*419,units]
+                return [419,0,units,'manual W/m/K']
             elif original_units.find('cal/cm/S/K') != -1:
-                return [value*419,uncertainty*419,units]
+                return [419,0,units,'manual W/m/K']
             elif original_units.find('Btu/ft/hr/F') != -1 or original_units.find('btu/ft/hr/F') != -1:
-                return [value*1.7307,uncertainty*1.7307,units]
+                return [1.7307,0,units,'manual W/m/K']
         
         # Convert Mass units for CPW, CVW, CPHEW to database units
         if units.find('J/K/kg') != -1:
             #print('original_units: '+original_units)
             #print('units: '+units)
             if original_units.find('J/K/g') != -1 or original_units.find('J/g/K') != -1:
-                return [value*0.001,uncertainty*0.001,units]
+                return [0.001,0,units,'manual J/K/kg']
             elif original_units.find('calorie/g/K') != -1 or original_units.find('calorie/K/g') != -1:
-                return [value*0.24,uncertainty*0.24,units]
+                return [0.24,0,units,'manual J/K/kg']
             elif original_units.find('kilocalorie/kg/K') != -1 or original_units.find('kilocalorie/K/kg') != -1:
-                return [value*0.24,uncertainty*0.24,units]
+                return [0.24,0,units,'manual J/K/kg']
             elif original_units.find('kilocalorie/g/K') != -1 or original_units.find('kilocalorie/K/g') != -1:
-                return [value*240,uncertainty*240,units]
+                return [240,0,units,'manual J/K/kg']
             elif original_units.find('calorie/kg/K') != -1 or original_units.find('calorie/K/kg') != -1:
-                return [value*0.00024,uncertainty*0.00024,units]
+                return [0.00024,0,units,'manual J/K/kg']
             elif original_units.find('Btu/R/lb') != -1 or original_units.find('btu/F/lb') != -1:
-                return [value*0.00024,uncertainty*0.00024,units]
+                return [0.00024,0,units,'manual J/K/kg']
             elif original_units.find('Btu/lb/R') != -1 or original_units.find('btu/lb/F') != -1:
-                return [value*0.00024,uncertainty*0.00024,units]
+                return [0.00024,0,units,'manual J/K/kg']
         
         # Convert Mass units for HW, HTRW, HEXW to database units
         if units.find('kJ/kg') != -1:
             #print('original_units: '+original_units)
             #print('units: '+units)
             if original_units.find('J/g') != -1:
-                return [value,uncertainty,units]
+                return [1,0,units,'manual kJ/kg']
             elif original_units.find('kJ/g') != -1:
-                return [value*0.001,uncertainty*0.001,units]
+                return [0.001,0,units,'manual kJ/kg']
             elif original_units.find('J/kg') != -1:
-                return [value*1000,uncertainty*1000,units]
+                return [1000,0,units,'manual kJ/kg']
             elif original_units.find('calorie/g') != -1:
-                return [value*0.24,uncertainty*0.24,units]
+                return [0.24,0,units,'manual kJ/kg']
             elif original_units.find('kilocalorie/kg') != -1:
-                return [value*0.24,uncertainty*0.24,units]
+                return [0.24,0,units,'manual kJ/kg']
             elif original_units.find('kilocalorie/g') != -1:
-                return [value*240,uncertainty*240,units]
+                return [240,0,units,'manual kJ/kg']
             elif original_units.find('calorie/kg') != -1:
-                return [value*0.00024,uncertainty*0.00024,units]
+                return [0.00024,0,units,'manual kJ/kg']
             elif original_units.find('Btu/lb') != -1:
-                return [value*0.43,uncertainty*0.43,units]
+                return [0.43,0,units,'manual kJ/kg']
 
         # Since units J/K/mol may have multiple conversions (i.e. from J/g, cal/g/K, and Btu/R/lb)
         # and pint only allows one conversion must do the second conversion manually here
@@ -466,23 +706,23 @@ def Convert_To_DB_Units(value, uncertainty, original_units, prop_sym):
             #print('original_units: '+original_units)
             #print('units: '+units)
             if original_units.find('calorie/cm/S/K') != -1:
-                return [value*4.184,uncertainty*4.184,units]
+                return [4.184,0,units,'manual J/K/mol']
             elif original_units.find('cal/cm/S/K') != -1:
-                return [value*4.184,uncertainty*4.184,units]
+                return [4.184,0,units,'manual J/K/mol']
             elif original_units.find('Btu/K/lb') != -1 or original_units.find('btu/K/lb') != -1:
-                return [value*2.326,uncertainty*2.326,units]
+                return [2.326,0,units,'manual J/K/mol']
             elif original_units.find('Btu/C/lb') != -1 or original_units.find('btu/C/lb') != -1:
-                return [value*2.326,uncertainty*2.326,units]
+                return [2.326,0,units,'manual J/K/mol']
             elif original_units.find('Btu/R/lb') != -1 or original_units.find('btu/R/lb') != -1:
-                return [value*4.1868,uncertainty*4.1868,units]
+                return [4.1868,0,units,'manual J/K/mol']
             elif original_units.find('Btu/F/lb') != -1 or original_units.find('btu/F/lb') != -1:
-                return [value*4.1868,uncertainty*4.1868,units]
+                return [4.1868,0,units,'manual J/K/mol']
             elif original_units.find('J/g') != -1:
-                return [value,uncertainty,units]
+                return [1,0,units,'manual J/K/mol']
             elif original_units.find('calorie/g/K') != -1:
-                return [value*4.184,uncertainty*4.184,units]
+                return [4.184,0,units,'manual J/K/mol']
             elif original_units.find('cal/g/K') != -1:
-                return [value*4.184,uncertainty*4.184,units]
+                return [4.184,0,units,'manual J/K/mol']
         
         # Since kJ/mol units may have multiple conversions (i.e. from J/g and Btu/lb)
         # and pint only allows one conversion must do the second conversion manually here
@@ -490,41 +730,41 @@ def Convert_To_DB_Units(value, uncertainty, original_units, prop_sym):
             #print('original_units: '+original_units)
             #print('units: '+units)
             if original_units.find('Btu/lb') != -1 or original_units.find('btu/lb') != -1:
-                return [value*2.326,uncertainty*2.326,units]
+                return [2.326,0,units,'manual kJ/mol']
             elif original_units.find('J/g') != -1:
-                return [value,uncertainty,units]
+                return [1,0,units,'manual kJ/mol']
             elif original_units.find('calorie/g') != -1:
-                return [value/4186806.0,uncertainty/4186806.0,units]
+                return [1/4186806.0,0,units,'manual kJ/mol']
 
         # Do conversion of microOhm*cm or Ohm*cm units to Ohm*m
         if units.find('Ohm*m') != -1 or units.find('ohm*m') != -1:
             #print('original_units: '+original_units)
             #print('units: '+units)
             if original_units.find('microOhm*cm') != -1 or original_units.find('microohm*cm') != -1:
-                return [value/(10**8),uncertainty/(10**8),units]
+                return [1/(10**8),0,units,'manual Ohm*m']
             elif original_units.find('microOhm*m') != -1 or original_units.find('microohm*m') != -1:
-                return [value/(10**6),uncertainty/(10**6),units]
+                return [1/(10**6),0,units,'manual Ohm*m']
             elif original_units.find('Ohm*cm') != -1 or original_units.find('ohm*cm') != -1:
-                return [value/(10**2),uncertainty/(10**2),units]
+                return [1/(10**2),0,units,'manual Ohm*m']
 
         # Do conversion of kg/cm**2 units to kPa
         if units.find('kPa') != -1:
             #print('original_units: '+original_units)
             #print('units: '+units)
             if original_units.find('kg/cm**2') != -1:
-                return [value*98.0665,uncertainty*98.0665,units]
+                return [98.0665,0,units,'manual kPa']
 
         # Do conversion of Gause or kiloGauss to Tesla: 1 Gauss = .0001 Tesla and 1 kiloG = .1 Telsa
         if units.find('T') != -1:
             if original_units.find('Gauss') != -1 or original_units.find('gauss') != -1:
-                return [value*.0001,uncertainty*.0001,units]
+                return [.0001,0,units,'manual T']
             elif original_units.find('kiloGauss') != -1 or original_units.find('kilogauss') != -1 or original_units.find('kiloG') != -1 or original_units.find('kG') != -1:
-                return [value*.1,uncertainty*.1,units]
+                return [.1,0,units,'manual T']
 
         # Do conversion of Oersted to Ampere/meter: 1 Gauss = .0001 Tesla and 1 kiloG = .1 Telsa
         if units.find('Ampere/m') != -1 or units.find('ampere/m') != -1:
             if original_units.find('Oersted') != -1 or original_units.find('oersted') != -1:
-                return [value*79.5578,uncertainty*79.5578,units]
+                return [79.5578,0,units,'manual Ampere/m']
 
         # Since GDC sometimes has mistakes like K/h which is Kelvin/Hour which must be K/hr
         # so handle these mistakes
@@ -546,17 +786,17 @@ def Convert_To_DB_Units(value, uncertainty, original_units, prop_sym):
             if units.find('A') != -1 and units.find('Angstrom') == -1 and units.find('angstrom') == -1:
                 # Do conversion of kX units to angstrom
                 if original_units.find('kX') != -1:
-                    return [value*1.00202,uncertainty*1.00202,'angstrom']
+                    return [1.00202,0,'angstrom','manual angstrom']
                 else:
                     units = units.replace('A','angstrom')
             elif units.find('Angstrom') != -1:
                 # Do conversion of kX units to angstrom
                 if original_units.find('kX') != -1:
-                    return [value*1.00202,uncertainty*1.00202,'angstrom']
+                    return [1.00202,0,'angstrom','manual angstrom']
                 else:
                     units = units.replace('Angstrom','angstrom')
             elif units.find('angstrom') != -1 and original_units.find('kX') != -1:
-                return [value*1.00202,uncertainty*1.00202,'angstrom']
+                return [1.00202,0,'angstrom','manual angstrom']
 
         # Since the database might have amperes written as 'A' for property WH, we should convert to 'amperes'
         # to avoid confusion. Now 'A' is seen as Amperes by pint but the confusion is just too great to leave it
@@ -573,90 +813,73 @@ def Convert_To_DB_Units(value, uncertainty, original_units, prop_sym):
         if prop_sym == 'EC':
             if original_units == 'S/cm':
                 units = 'S/m'
-                return [value*100.0,uncertainty*100.0,units]
+                return [100.0,0,units,'manual S/m']
 
         # If the original value is dimensionless, we only want to return the value if the
         # units match the property units.
         if original_units == 'None' and units == 'None':
-            return [value,uncertainty,'None']
+            return [1,0,'None','dimensionless']
         elif original_units == 'Unknown' and units == 'None':
-            return [value,uncertainty,'None']
+            return [1,0,'None','dimensionless']
         elif original_units == 'None' and units != 'None':
-            return [None,None,'None']
+            return [None,None,'None','not convertible']
         elif original_units == 'Unknown' and units != 'None':
-            return [None,None,'None']
+            return [None,None,'None','not convertible']
         
         # Main conversion
-        # Use pint to do the conversion.
+        # Use pint to do the conversion. The factor is the converted value of 1 and the
+        # offset is the converted value of 0 (which is only non zero for units with shifts).
+        ur = Get_Unit_Registry()
+        from pint.errors import DimensionalityError
+        from pint.errors import UndefinedUnitError
         try:
-            return [(value*ur[original_units]).to(units).magnitude,(uncertainty*ur[original_units]).to(units).magnitude,units]
-        except DimensionalityError:
-            try:
-                temp_original_units = original_units.replace('/','_')
-                temp_original_units = temp_original_units.replace('*','_')
-                temp_units = units.replace('/','_')
-                temp_units = temp_units.replace('*','_')
-                return [(value*ur[temp_original_units]).to(temp_units).magnitude,(uncertainty*ur[temp_original_units]).to(temp_units).magnitude,units]
-            except Exception as err:
-                print("Exception: {0}".format(err))
-                print("prop_sym: "+prop_sym)
-                print("value: "+str(value))
-                print("uncertainty: "+str(uncertainty))
-                print("original_units: "+original_units)
-                print("units: "+units)
-                return [value,uncertainty,original_units]
-        except UndefinedUnitError:
+            return [(1*ur[original_units]).to(units).magnitude-(0*ur[original_units]).to(units).magnitude,(0*ur[original_units]).to(units).magnitude,units,'pint direct']
+        except (DimensionalityError, UndefinedUnitError):
             try:
                 temp_original_units = original_units.replace('/','_')
                 temp_original_units = temp_original_units.replace('*','_')
                 temp_units = units.replace('/','_')
                 temp_units = temp_units.replace('*','_')
-                return [(value*ur[temp_original_units]).to(temp_units).magnitude,(uncertainty*ur[temp_original_units]).to(temp_units).magnitude,units]
+                return [(1*ur[temp_original_units]).to(temp_units).magnitude-(0*ur[temp_original_units]).to(temp_units).magnitude,(0*ur[temp_original_units]).to(temp_units).magnitude,units,'underscore retry']
             except Exception as err:
-                print("Exception: {0}".format(err))
-                print("prop_sym: "+prop_sym)
-                print("value: "+str(value))
-                print("uncertainty: "+str(uncertainty))
-                print("original_units: "+original_units)
-                print("units: "+units)
-                return [value,uncertainty,original_units]
+                # The value can not be converted so it is passed on unchanged. Keep the error
+                # in the telemetry instead of printing it for every value.
+                conversion_errors[error_key] = "{0} (units: {1})".format(err, units)
+                return [1,0,original_units,'failed']
         except Exception as err:
-            print("Exception: {0}".format(err))
-            print("prop_sym: "+prop_sym)
-            print("value: "+str(value))
-            print("uncertainty: "+str(uncertainty))
-            print("original_units: "+original_units)
-            print("units: "+units)
-            return [value,uncertainty,original_units]
+            conversion_errors[error_key] = "{0} (units: {1})".format(err, units)
+            return [1,0,original_units,'failed']
+
+# The atomic weight of every element, built once rather than on every call of Get_Molar_Weight.
+# The below values come from the 90th edition of the Handbook of Chemistry and Physics
+atomic_weights = {'Ac': 227.0277, 'Al': 26.98153868, 'Am': 243.0614, 'Sb': 121.7601, 'Ar': 39.9481, 'As': 74.921602, 'At': 209.9871, 'Ba': 137.3277, 'Bk': 247.0703, 
+                'Be': 9.0121823, 'Bi': 208.980401, 'Bh': 264.12, 'B': 10.8117, 'Br': 79.9041, 'Cd': 112.4118, 'Ca': 40.0784, 'Cf': 251.0796, 'C': 12.01078, 
+                'Ce': 140.1161, 'Cs': 132.90545192, 'Cl': 35.4532, 'Cr': 51.99616, 'Co': 58.9331955, 'Cu': 63.5463, 'Cm': 247.0704, 'Ds': 271, 'Db': 262.1141, 
+                'Dy': 162.5001, 'Es': 252.0830, 'Er': 167.2593, 'Eu': 151.9641, 'Fm': 257.0951, 'F': 18.99840325, 'Fr': 223.0197, 'Gd': 157.253, 'Ga': 69.7231, 
+                'Ge': 72.641, 'Au': 196.9665694, 'Hf': 178.492, 'Hs': 277, 'He': 4.0026022, 'Ho': 164.930322, 'H': 1.007947, 'In': 114.8183, 'I': 126.904473, 
+                'Ir': 192.2173, 'Fe': 55.8452, 'Kr': 83.7982, 'La': 138.905477, 'Lr': 262.1097, 'Pb': 207.21, 'Li': 6.9412, 'Lu': 174.96681, 'Mg': 24.30506, 
+                'Mn': 54.9380455, 'Mt': 268.1388, 'Md': 258.0984, 'Hg': 200.592, 'Mo': 95.962, 'Nd': 144.2423, 'Ne': 20.17976, 'Np': 237.0482, 'Ni': 58.69344, 
+                'Nb': 92.906382, 'N': 14.00672, 'No': 259.1010, 'Os': 190.233, 'O': 15.99943, 'Pd': 106.421, 'P': 30.9737622, 'Pt': 195.0849, 'Pu': 244.0642, 
+                'Po': 208.9824, 'K': 39.09831, 'Pr': 140.907652, 'Pm': 144.9127, 'Pa': 231.035882, 'Ra': 226.0254, 'Rn': 222.0176, 'Re': 186.2071, 'Rh': 102.905502, 
+                'Rg': 272.1535, 'Rb': 85.46783, 'Ru': 101.072, 'Rf': 261.1088, 'Sm': 150.362, 'Sc': 44.9559126, 'Sg': 266.1219, 'Se': 78.963, 'Si': 28.08553, 
+                'Ag': 107.86822, 'Na': 22.989769282, 'Sr': 87.621, 'S': 32.0655, 'Ta': 180.947882, 'Tc': 97.9072, 'Te': 127.603, 'Tb': 158.925352, 'Tl': 204.38332, 
+                'Th': 232.038062, 'Tm': 168.934212, 'Sn': 118.7107,'Ti': 47.8671, 'W': 183.841, 'Uub': 285, 'Uuh': 289, 'Uuq': 289, 'U': 238.028913, 'V': 50.84151, 
+                'Xe': 131.2936, 'Yb': 173.0545, 'Y': 88.905852, 'Zn': 65.382, 'Zr': 91.2242}
 
 # This function, given a list of elements and a list of their subscripts in a compound,
 # returns the molar weight of the compound.
 # Since it is an internal function, it does not need the parameter definition.
 def Get_Molar_Weight(elements, subscripts=None):
-    # The below values come from the 90th edition of the Handbook of Chemistry and Physics
-    molar_weights = {'Ac': 227.0277, 'Al': 26.98153868, 'Am': 243.0614, 'Sb': 121.7601, 'Ar': 39.9481, 'As': 74.921602, 'At': 209.9871, 'Ba': 137.3277, 'Bk': 247.0703, 
-                    'Be': 9.0121823, 'Bi': 208.980401, 'Bh': 264.12, 'B': 10.8117, 'Br': 79.9041, 'Cd': 112.4118, 'Ca': 40.0784, 'Cf': 251.0796, 'C': 12.01078, 
-                    'Ce': 140.1161, 'Cs': 132.90545192, 'Cl': 35.4532, 'Cr': 51.99616, 'Co': 58.9331955, 'Cu': 63.5463, 'Cm': 247.0704, 'Ds': 271, 'Db': 262.1141, 
-                    'Dy': 162.5001, 'Es': 252.0830, 'Er': 167.2593, 'Eu': 151.9641, 'Fm': 257.0951, 'F': 18.99840325, 'Fr': 223.0197, 'Gd': 157.253, 'Ga': 69.7231, 
-                    'Ge': 72.641, 'Au': 196.9665694, 'Hf': 178.492, 'Hs': 277, 'He': 4.0026022, 'Ho': 164.930322, 'H': 1.007947, 'In': 114.8183, 'I': 126.904473, 
-                    'Ir': 192.2173, 'Fe': 55.8452, 'Kr': 83.7982, 'La': 138.905477, 'Lr': 262.1097, 'Pb': 207.21, 'Li': 6.9412, 'Lu': 174.96681, 'Mg': 24.30506, 
-                    'Mn': 54.9380455, 'Mt': 268.1388, 'Md': 258.0984, 'Hg': 200.592, 'Mo': 95.962, 'Nd': 144.2423, 'Ne': 20.17976, 'Np': 237.0482, 'Ni': 58.69344, 
-                    'Nb': 92.906382, 'N': 14.00672, 'No': 259.1010, 'Os': 190.233, 'O': 15.99943, 'Pd': 106.421, 'P': 30.9737622, 'Pt': 195.0849, 'Pu': 244.0642, 
-                    'Po': 208.9824, 'K': 39.09831, 'Pr': 140.907652, 'Pm': 144.9127, 'Pa': 231.035882, 'Ra': 226.0254, 'Rn': 222.0176, 'Re': 186.2071, 'Rh': 102.905502, 
-                    'Rg': 272.1535, 'Rb': 85.46783, 'Ru': 101.072, 'Rf': 261.1088, 'Sm': 150.362, 'Sc': 44.9559126, 'Sg': 266.1219, 'Se': 78.963, 'Si': 28.08553, 
-                    'Ag': 107.86822, 'Na': 22.989769282, 'Sr': 87.621, 'S': 32.0655, 'Ta': 180.947882, 'Tc': 97.9072, 'Te': 127.603, 'Tb': 158.925352, 'Tl': 204.38332, 
-                    'Th': 232.038062, 'Tm': 168.934212, 'Sn': 118.7107,'Ti': 47.8671, 'W': 183.841, 'Uub': 285, 'Uuh': 289, 'Uuq': 289, 'U': 238.028913, 'V': 50.84151, 
-                    'Xe': 131.2936, 'Yb': 173.0545, 'Y': 88.905852, 'Zn': 65.382, 'Zr': 91.2242}
     # If only one element is passed, we just need to return the molar weight 
     # of that element
     if subscripts == None or type(elements) == str:
-        return molar_weights[elements]
+        return atomic_weights[elements]
     # If more than one element is passed, the molar weight is the sum of all
     # the molar weights of the atoms.
     else:
         molar_weight = 0
         for i in range(len(subscripts)):
-            molar_weight += subscripts[i]*molar_weights[elements[i]]
+            molar_weight += subscripts[i]*atomic_weights[elements[i]]
         return molar_weight
 
 # This function converts a list of mol fractions to weight fractions and
@@ -671,17 +894,62 @@ def Convert_Molar_Mass_Frac(elements, fractions, is_mass_frac, molar_weights = N
         molar_weights = []
         for element in elements:
             molar_weights.append(Get_Molar_Weight(element))
+    # The normalizing sum is the same for every component, so it is only calculated once
     if is_mass_frac:
+        total = sum([fractions[j]/molar_weights[j] for j in range(len(fractions))])
         mol_fractions = []
         for i in range(len(fractions)):
-            mol_fractions.append(fractions[i]/molar_weights[i]/(sum([fractions[j]/molar_weights[j] for j in range(len(fractions))])))
+            mol_fractions.append(fractions[i]/molar_weights[i]/total)
         return mol_fractions
     else:
+        total = sum([fractions[j]*molar_weights[j] for j in range(len(fractions))])
         weight_fractions = []
         for i in range(len(fractions)):
-            weight_fractions.append(fractions[i]*molar_weights[i]/(sum([fractions[j]*molar_weights[j] for j in range(len(fractions))])))
+            weight_fractions.append(fractions[i]*molar_weights[i]/total)
         return weight_fractions
 
+# Returns the molar weights of a list of elements (or compound formulas, see Parse_Formula) as a read only
+# NumPy vector, built once for every list of elements.
+# Internal function, so we don't need the parameter definition line.
+@lru_cache(maxsize=256)
+def Molar_Weight_Vector(elements):
+    molar_weights = []
+    for element in elements:
+        if element in atomic_weights:
+            molar_weights.append(atomic_weights[element])
+        else:
+            atoms = Parse_Formula(element)
+            molar_weights.append(Get_Molar_Weight([symbol for symbol, subscript in atoms], [subscript for symbol, subscript in atoms]))
+    molar_weights = np.array(molar_weights, dtype=float)
+    molar_weights.setflags(write=False)
+    return molar_weights
+
+# Batch version of Convert_Molar_Mass_Frac for composition studies over many alloys at once.
+# fractions is an (n_alloys x n_elements) matrix (a single alloy may be passed as a vector) whose columns are
+# the elements, and the mol fractions are converted into mass fractions or the mass fractions (is_mass_frac)
+# into mol fractions. The molar weights of the elements are taken from Molar_Weight_Vector unless they are
+# given. Returns a list of [converted fractions, effective molar weights] where the effective molar weight
+# of every alloy is the sum of its mol fractions times the molar weights (as in Molar_Context).
+# Alloys whose fractions are all zero give NaN fractions.
+# Internal function, so we don't need the parameter definition line.
+def Convert_Molar_Mass_Frac_Array(elements, fractions, is_mass_frac, molar_weights = None):
+    fractions = np.asarray(fractions, dtype=float)
+    if molar_weights is None:
+        molar_weights = Molar_Weight_Vector(tuple(elements))
+    molar_weights = np.asarray(molar_weights, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if is_mass_frac:
+            moles = fractions/molar_weights
+            total_moles = moles.sum(axis=-1, keepdims=True)
+            converted = moles/total_moles
+            # sum(x*M) = sum(w)/sum(w/M)
+            effective_molar_weights = fractions.sum(axis=-1)/total_moles[..., 0]
+        else:
+            masses = fractions*molar_weights
+            effective_molar_weights = masses.sum(axis=-1)
+            converted = masses/effective_molar_weights[..., np.newaxis]
+    return [converted, effective_molar_weights]
+
 # Molar to mass value conversion function
 # Called by another function in Python, so we don't need the parameter definition line.
 # If it receives a unit that includes mols, it converts
@@ -732,56 +1000,126 @@ def Molar_Mass_Conversion(value, original_units, molar_weight):
         return [value, original_units]
     return [value, new_units]
 
+# The tokens of a chemical formula: an element symbol, a number (a subscript, the multiplier of a group
+# or the coefficient of a hydrate part), an opening or closing bracket or a hydrate separator (i.e. the
+# dot of CuSO4·5H2O, "*" can be used as well since a "." is always part of a number)
+formula_tokens = re.compile(r'\s*(?:([A-Z][a-z]{0,2})|(\d+\.?\d*|\.\d+)|([(\[])|([)\]])|([·•*]))')
+# The fraction at the start of an entry of a compound list (i.e. the 0.85 of 0.85Al2O3)
+compound_fraction = re.compile(r'\s*(\d+\.?\d*|\.\d+)?')
+
+# This is an internally called function, so it does not need a parameter definition.
+# Parses a chemical formula such as 'Al2O3', 'Ca(OH)2', 'K4[Fe(CN)6]' or 'CuSO4·5H2O' into a tuple of
+# (element, subscript) pairs in the order the elements appear, with the multipliers of the groups and
+# the coefficients of the hydrate parts applied (i.e. 'Ca(OH)2' gives (('Ca', 1.0), ('O', 2.0), ('H', 2.0))).
+# The results are cached since the same few formulas are parsed over and over.
+@lru_cache(maxsize=4096)
+def Parse_Formula(formula):
+    groups = [[]] # the open groups, each a list of [element, subscript]
+    part_start = 0 # where the current hydrate part starts in the outermost group
+    last = [] # the atoms a number that follows applies to (the last element or the last closed group)
+    last_is_element = False
+    coefficient = None # the coefficient of the current hydrate part
+    position = 0
+    formula = formula.rstrip()
+    while position < len(formula):
+        token = formula_tokens.match(formula, position)
+        if token is None or token.end() == position:
+            raise ValueError(f"Can not parse the chemical formula {formula!r}")
+        position = token.end()
+        element, number, opening, closing, separator = token.groups()
+        if element is not None:
+            atom = [element, 1.0]
+            groups[-1].append(atom)
+            last = [atom]
+            last_is_element = True
+        elif number is not None:
+            if last_is_element:
+                # The subscript of an element
+                last[0][1] = float(number)
+            elif len(last) > 0:
+                # The multiplier of a group
+                for atom in last:
+                    atom[1] *= float(number)
+            elif len(groups) == 1 and len(groups[0]) == part_start and coefficient is None:
+                # The coefficient of a hydrate part
+                coefficient = float(number)
+            else:
+                raise ValueError(f"Can not parse the chemical formula {formula!r}")
+            last = []
+            last_is_element = False
+        elif opening is not None:
+            groups.append([])
+            last = []
+            last_is_element = False
+        elif closing is not None:
+            if len(groups) == 1 or len(groups[-1]) == 0:
+                raise ValueError(f"Can not parse the chemical formula {formula!r}")
+            group = groups.pop()
+            groups[-1].extend(group)
+            last = group
+            last_is_element = False
+        else:
+            if len(groups) > 1:
+                raise ValueError(f"Can not parse the chemical formula {formula!r}")
+            Apply_Coefficient(groups[0][part_start:], coefficient)
+            part_start = len(groups[0])
+            coefficient = None
+            last = []
+            last_is_element = False
+    if len(groups) > 1 or len(groups[0]) == part_start:
+        raise ValueError(f"Can not parse the chemical formula {formula!r}")
+    Apply_Coefficient(groups[0][part_start:], coefficient)
+    return tuple((element, subscript) for element, subscript in groups[0])
+
+# Multiplies the subscripts of the atoms of a hydrate part by its coefficient (if it has one).
+# Internal function, so we don't need the parameter definition line.
+def Apply_Coefficient(atoms, coefficient):
+    if coefficient is not None:
+        for atom in atoms:
+            atom[1] *= coefficient
+
 # This is an internally called function, so it does not need a parameter definition.
 # It's passed an array of strings in a format like ['0.85Al2O3','0.10SiO2','0.05Al'].
 # The decimal at the start of the string is the fraction of that compound in the mixture,
-# which is followed by the chemical formula for that compound.
+# which is followed by the chemical formula for that compound (see Parse_Formula).
 # Returns an array of fractions and molar weights for each compound.
 def Parse_Compound_List(compounds):
     fractions = []
     molar_weights = []
     for compound in compounds:
-        elements = []
-        subscripts = []
-        elemInd = []
-        for index, char in enumerate(compound):
-            if char.isupper():
-                elemInd.append(index)
-                try:
-                    # If a lowercase letter follows the capital letter,
-                    # then we append both letters to the element name
-                    if compound[index+1].islower():
-                        elements.append(compound[index:index+2])
-                    # Otherwise the element must have a single letter symbol
-                    else:
-                        elements.append(char)
-                except:
-                    # If there's an exception, it's because we tried to access 
-                    # a character past the end of the compound string,
-                    # meaning the element must have a single letter symbol.
-                    elements.append(char)
-                # If a capital letter directly follows another letter, there
-                # must be an implied 1 subscript between the two.
-                if compound[index-1].isalpha() and index > 0:
-                    subscripts.append(1.0)
-                # Otherwise, we take the range between the two element names
-                # to get the subscript.
-                elif len(elements) > 1:
-                    subscripts.append(float(compound[elemInd[-2]+len(elements[-2]):elemInd[-1]]))
-        # We need to add the subscript at the end of the compound if there is one,
-        # since the above for loop does not check for that.
-        if compound[-1].isdigit():
-            subscripts.append(float(compound[elemInd[-1]+len(elements[-1]):]))
-        # If there's no number at the end, the subscript is an implied 1.
-        else:
-            subscripts.append(1.0)
-
-        molar_weights.append(Get_Molar_Weight(elements, subscripts))
+        fraction = compound_fraction.match(compound)
+        atoms = Parse_Formula(compound[fraction.end():])
+        molar_weights.append(Get_Molar_Weight([element for element, subscript in atoms], [subscript for element, subscript in atoms]))
         if len(compounds) == 1:
             fractions.append(1)
+        elif fraction.group(1) is None:
+            raise ValueError(f"The compound {compound!r} has no fraction")
         else:
-            fractions.append(float(compound[:elemInd[0]]))
+            fractions.append(float(fraction.group(1)))
     return fractions, molar_weights
+
+# This is an internally called function, so it does not need a parameter definition.
+# Returns the molar context of a compound string such as "0.85Al2O3,0.10SiO2,0.05Al" (see
+# Process_Value_For_Molar_Conversion): [fractions, molar_weights, mol_fractions, effective_molar_weight]
+# where the lists are tuples. It is cached by the compound string and is_mass_frac, so the conversions of
+# every value of a data set (which all have the same composition) share one parse.
+@lru_cache(maxsize=1024)
+def Molar_Context(compound, is_mass_frac):
+    fractions, molar_weights = Parse_Compound_List(compound.split(','))
+    # If the coefficients are given as mass fraction, we first convert to mol 
+    # fraction to be able to calculate the effective molecular weight
+    if is_mass_frac:
+        mol_fractions = Convert_Molar_Mass_Frac(None, fractions, is_mass_frac, molar_weights)
+    else:
+        mol_fractions = fractions
+    # We use a simplistic calculation for the effective molar weight.
+    # This ignores the fact that compounds can have different molar weights
+    # with the same fractional compositions. We simply add the mol fraction
+    # of each component times that component's molar weight.
+    effective_molar_weight = 0
+    for i in range(len(fractions)):
+        effective_molar_weight += mol_fractions[i]*molar_weights[i]
+    return (tuple(fractions), tuple(molar_weights), tuple(mol_fractions), effective_molar_weight)
     
 # Processes the value to be passed to the actual
 # conversion function for molar/mass conversion.
@@ -797,28 +1135,11 @@ def Process_Value_For_Molar_Conversion(tuple0, tuple1, tuple2):
     # (i.e. "Cu")
     # The mass fraction bool is true if the coefficients for the compounds are mass fractions, 
     # and false if the coefficients are mol fractions.
-    value_input = tuple0[3].split(',')
-    value_name = tuple0[5]
-    original_units = tuple0[6]
-    original_value = float(value_input[0])
-    original_uncertainty = float(value_input[1])
-    compounds = tuple1[4].split(',')
-    is_mass_frac = (tuple2[0] == 'True')
-    fractions, molar_weights = Parse_Compound_List(compounds)
-    effective_molar_weight = 0
-    # If the coefficients are given as mass fraction, we first convert to mol 
-    # fraction to be able to calculate the effective molecular weight
-    if is_mass_frac:
-        mol_fractions = Convert_Molar_Mass_Frac(None, fractions, is_mass_frac, molar_weights)
-    else:
-        mol_fractions = fractions
-        
-    # We use a simplistic calculation for the effective molar weight.
-    # This ignores the fact that compounds can have different molar weights
-    # with the same fractional compositions. We simply add the mol fraction
-    # of each component times that component's molar weight.
-    for i in range(len(fractions)):
-        effective_molar_weight += mol_fractions[i]*molar_weights[i]
+    original_value, original_uncertainty, original_units, value_name = Read_Value(tuple0)
+    compound = tuple1 if isinstance(tuple1, str) else tuple1[4]
+    is_mass_frac = tuple2 if isinstance(tuple2, bool) else (tuple2[0] == 'True')
+    # The compound string is only parsed the first time it is seen
+    effective_molar_weight = Molar_Context(compound, is_mass_frac)[3]
     converted_value, new_units = Molar_Mass_Conversion(original_value, original_units, effective_molar_weight)
     converted_uncertainty, new_units = Molar_Mass_Conversion(original_uncertainty, original_units, effective_molar_weight)
     return ['double', converted_value, converted_uncertainty, new_units, value_name]
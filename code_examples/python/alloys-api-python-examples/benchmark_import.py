@@ -0,0 +1,38 @@
+# This script measures how long it takes to import the ConversionLibrary in a fresh python process
+# (which is what every script and every forked worker pays) and how much more it would cost if the
+# pint unit registry had to be built as well, i.e. when a unit is not in the precompiled conversion table.
+# Run it from this folder:
+#       python benchmark_import.py [number of runs]
+import sys
+import subprocess
+import statistics
+
+import_only = """
+import time
+start = time.perf_counter()
+import ConversionLibrary
+print(time.perf_counter()-start)
+"""
+
+import_with_pint = """
+import time
+start = time.perf_counter()
+import ConversionLibrary
+ConversionLibrary.Get_Unit_Registry()
+print(time.perf_counter()-start)
+"""
+
+def time_import(code, runs):
+    times = []
+    for i in range(runs):
+        output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout
+        times.append(float(output.split()[-1]))
+    return statistics.median(times)
+
+if __name__ == '__main__':
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    table_time = time_import(import_only, runs)
+    pint_time = time_import(import_with_pint, runs)
+    print(f"import ConversionLibrary (precompiled table): {table_time*1000:.1f} ms")
+    print(f"import ConversionLibrary + pint unit registry: {pint_time*1000:.1f} ms")
+    print(f"speedup: {pint_time/table_time:.1f}x")
@@ -0,0 +1,56 @@
+# This script compares the JSON backends of json_loader (orjson and msgspec when they are installed and
+# the standard library json module) on Test.json and the output_examples. For every file it checks that
+# each backend decodes to exactly the same python objects as the json module (same types, same key order,
+# same float values) and reports the parse throughput of each backend in MB/s.
+# Run it from this folder:
+#       python benchmark_json.py [number of runs] [JSON files...]
+import sys
+import glob
+import json
+import time
+import statistics
+import json_loader
+
+# Two decoded documents are identical if their repr is identical, which unlike == also tells
+# 1 from 1.0 and True from 1 and compares the order of the keys
+def identical(a, b):
+    return type(a) is type(b) and repr(a) == repr(b)
+
+def time_decode(decode, data, runs):
+    times = []
+    for i in range(runs):
+        start = time.perf_counter()
+        decode(data)
+        times.append(time.perf_counter()-start)
+    return statistics.median(times)
+
+if __name__ == '__main__':
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    files = sys.argv[2:]
+    if len(files) == 0:
+        files = ['Test.json'] + sorted(glob.glob('../../../output_examples/*.json'))
+
+    backends = json_loader.json_backends
+    print(f"{'file':45} {'MB':>6} " + ' '.join(f"{name+' MB/s':>14}" for name in backends) + '  identical')
+    totals = {name: 0.0 for name in backends}
+    total_size = 0
+    all_identical = True
+    for file in files:
+        with open(file, 'rb') as json_file:
+            data = json_file.read()
+        size = len(data)/1e6
+        total_size += size
+        expected = json.loads(data)
+        same = True
+        speeds = []
+        for name, decode in backends.items():
+            same = same and identical(decode(data), expected)
+            seconds = time_decode(decode, data, runs)
+            totals[name] += seconds
+            speeds.append(size/seconds)
+        all_identical = all_identical and same
+        print(f"{file[-45:]:45} {size:6.2f} " + ' '.join(f"{speed:14.1f}" for speed in speeds) + f"  {same}")
+    print(f"{'total':45} {total_size:6.2f} " + ' '.join(f"{total_size/totals[name]:14.1f}" for name in backends) + f"  {all_identical}")
+    print(f"json_loader backend: {json_loader.json_backend}")
+    if not all_identical:
+        sys.exit(1)
@@ -0,0 +1,68 @@
+# This script compares the per call time of the scalar ITS-90 normalization of NormalizationLibrary, which looks the
+# bracketing entries up in the precompiled tables (directly on the uniform 1 K grids and with a bisection otherwise),
+# with the previous implementation, which built the table as a list of tuples and searched it entry by entry.
+# For every conversion table it checks that both give exactly the same temperatures, then it times Temperature
+# for a few citation years and temperature scales the same way.
+# Run it from this folder:
+#       python benchmark_normalization.py [number of temperatures]
+import sys
+import time
+import numpy as np
+import NormalizationLibrary as NL
+from measurement import Measurement
+
+# The interpolation as it was before the tables were compiled
+def linear_interpolate(temperature_input, temperature_table):
+    temperature_table = list(temperature_table)
+    if temperature_input < temperature_table[0][0] or temperature_input > temperature_table[-1][0]:
+        return temperature_input
+    if temperature_input == temperature_table[0][0]:
+        return temperature_input+temperature_table[0][1]
+    elif temperature_input == temperature_table[-1][0]:
+        return temperature_input+temperature_table[-1][1]
+    for temperature_tuple in temperature_table:
+        if temperature_tuple[0] <= temperature_input:
+            temperature_1, temperature_1_delta = temperature_tuple
+        else:
+            temperature_2, temperature_2_delta = temperature_tuple
+            break
+    temperature_input_delta = (temperature_2_delta-temperature_1_delta)/(temperature_2-temperature_1)*(temperature_input-temperature_1)+temperature_1_delta
+    return temperature_input+temperature_input_delta
+
+def time_calls(function, temperatures):
+    start = time.perf_counter()
+    results = [function(temperature) for temperature in temperatures]
+    return [results, (time.perf_counter()-start)/len(temperatures)]
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    rng = np.random.default_rng(0)
+    all_identical = True
+
+    print(f"{'table':22} {'entries':>7} {'lookup':>9} {'before us':>10} {'after us':>9} {'speedup':>8}  identical")
+    for name, table in NL.compiled_temperature_tables.items():
+        points = table['points']
+        temperatures = list(rng.uniform(min(points), max(points), count)) + [float(point) for point in points]
+        before, before_time = time_calls(lambda t: linear_interpolate(t, zip(table['points'], table['values'])), temperatures)
+        after, after_time = time_calls(lambda t: NL.Interpolate_Table(t, table), temperatures)
+        same = before == after
+        all_identical = all_identical and same
+        lookup = 'direct' if table['step'] is not None else 'bisect'
+        print(f"{name:22} {len(points):7} {lookup:>9} {before_time*1e6:10.2f} {after_time*1e6:9.2f} {before_time/after_time:7.1f}x  {same}")
+
+    print()
+    print(f"{'Temperature':22} {'before us':>10} {'after us':>9} {'speedup':>8}")
+    interpolate = NL.Interpolate_Table
+    temperatures = list(rng.uniform(5, 2000, count))
+    for year, temperature_scale in [(1935, ''), (1960, ''), (1972, ''), (1980, ''), (2000, 'IPTS-68'), (2000, 'NBS-55')]:
+        values = [Measurement(temperature, 0.1, 'K', 'T') for temperature in temperatures]
+        after, after_time = time_calls(lambda v: NL.Temperature(v, year, temperature_scale)[1], values)
+        NL.Interpolate_Table = lambda t, table: linear_interpolate(t, zip(table['points'], table['values']))
+        try:
+            before, before_time = time_calls(lambda v: NL.Temperature(v, year, temperature_scale)[1], values)
+        finally:
+            NL.Interpolate_Table = interpolate
+        all_identical = all_identical and before == after
+        print(f"{str(year)+' '+temperature_scale:22} {before_time*1e6:10.2f} {after_time*1e6:9.2f} {before_time/after_time:7.1f}x")
+    if not all_identical:
+        sys.exit(1)
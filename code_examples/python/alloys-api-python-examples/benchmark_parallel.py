@@ -0,0 +1,65 @@
+# This script measures how load_trc_data_parallel scales with the number of processes on a large TRC_data
+# file (i.e. a full property dump) and checks that it gives the same data as json_loader.load_file. It also
+# times map_citations_parallel, which does the per citation work in the workers, against doing it in one process.
+# Run it from this folder:
+#       python benchmark_parallel.py [file.json] [largest number of processes]
+# Without a file (or with ''), Test.json is repeated 50 times into a temporary file to get a large enough document.
+import os
+import sys
+import json
+import time
+import tempfile
+import json_loader
+import trc_parallel
+
+# The kind of per citation work that is worth doing in the workers, only a number is sent back
+def count_data_values(a):
+    return sum(len(d['data_values']) for b in a.get('systems', []) for c in b.get('data_sets', []) for d in c.get('data', []))
+
+def make_large_file():
+    data = json_loader.load_file('Test.json')
+    data['TRC_data'] = data['TRC_data']*50
+    handle, path = tempfile.mkstemp(suffix='.json')
+    with os.fdopen(handle, 'w') as fp:
+        json.dump(data, fp)
+    return path
+
+if __name__ == '__main__':
+    temporary = len(sys.argv) < 2 or sys.argv[1] == ''
+    path = make_large_file() if temporary else sys.argv[1]
+    max_processes = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+    size = os.path.getsize(path)/1e6
+
+    start = time.perf_counter()
+    expected = json_loader.load_file(path)
+    single_time = time.perf_counter()-start
+    print(f"{size:.1f} MB, json_loader backend: {json_loader.json_backend}")
+    print(f"json_loader.load_file: {single_time:.2f} s ({size/single_time:.1f} MB/s)")
+
+    start = time.perf_counter()
+    with open(path, 'rb') as json_file:
+        boundaries = trc_parallel.find_citation_boundaries(json_file.read())
+    print(f"citation boundary scan: {time.perf_counter()-start:.2f} s ({len(boundaries[2])+1} citations)")
+
+    start = time.perf_counter()
+    expected_counts = [count_data_values(a) for a in json_loader.load_file(path)['TRC_data']]
+    single_map_time = time.perf_counter()-start
+    print(f"load_file and count data values: {single_map_time:.2f} s")
+
+    trc_parallel.parallel_min_size = 0
+    processes = 2
+    while processes <= max(max_processes, 2):
+        start = time.perf_counter()
+        data = trc_parallel.load_trc_data_parallel(path, processes=processes)
+        parallel_time = time.perf_counter()-start
+        print(f"load_trc_data_parallel with {processes} processes: {parallel_time:.2f} s ({size/parallel_time:.1f} MB/s), "
+              f"speedup {single_time/parallel_time:.2f}x, identical {data == expected}")
+        start = time.perf_counter()
+        counts = trc_parallel.map_citations_parallel(path, count_data_values, processes=processes)
+        map_time = time.perf_counter()-start
+        print(f"map_citations_parallel with {processes} processes: {map_time:.2f} s, "
+              f"speedup {single_map_time/map_time:.2f}x, identical {counts == expected_counts}")
+        processes *= 2
+
+    if temporary:
+        os.remove(path)
@@ -0,0 +1,26 @@
+# This script builds compound_resolver.json, which the CompoundResolver of compound_resolver.py loads so that
+# compounds can be resolved to their compound_ids without downloading any data first. It reads the API's
+# compound list (the output of compoundlist, by default output_examples/compound_list.json) and learns the
+# compound_id, names, CAS number and InChIKey of every compound in the TRC data files given after it
+# (by default Test.json and the output_examples). An existing compound_resolver.json is extended, and its
+# compound list is only replaced if the given one is different.
+# Run it from this folder whenever a new compound list or new data is available:
+#       python build_compound_resolver.py [compound_list.json] [TRC data json files...]
+import sys
+import glob
+import json_loader
+from compound_resolver import CompoundResolver
+
+if __name__ == '__main__':
+    compound_list_file = sys.argv[1] if len(sys.argv) > 1 else '../../../output_examples/compound_list.json'
+    files = sys.argv[2:]
+    if len(files) == 0:
+        files = ['Test.json'] + sorted(glob.glob('../../../output_examples/*.json'))
+    resolver = CompoundResolver()
+    list_changed = resolver.update_compound_list(json_loader.load_file(compound_list_file))
+    for file in files:
+        data = json_loader.load_file(file)
+        resolver.add_citations(data.get('TRC_data', []))
+    resolver.save()
+    print(f"{len(resolver.compounds)} compounds and {len(resolver.compound_list)} compound list entries "
+          f"({'updated' if list_changed else 'unchanged'}) written to {resolver.path}")
@@ -0,0 +1,66 @@
+# This script builds the precompiled conversion table (conversion_table.json) used by the ConversionLibrary
+# so that importing the library does not need to build the pint unit registry. It finds every
+# (property, units) pair in the TRC data files given on the command line (by default Test.json and the
+# output_examples) and, for each one, uses pint to resolve the conversion into the database units given
+# by the UnitsStandard table as well as the plain unit conversion into those database units.
+#
+# Run it from this folder whenever TRC_units_conversion.txt, the UnitsStandard table or the special
+# case conversions in the ConversionLibrary change:
+#       python build_conversion_table.py [TRC data json files...]
+import sys
+import glob
+import json
+import json_loader
+import ConversionLibrary as CL
+
+# Find every (property, units) pair used by a variable in the TRC data files
+def find_units(files):
+    units = set()
+    for file in files:
+        data = json_loader.load_file(file)
+        if 'TRC_data' not in data:
+            continue
+        for a in data['TRC_data']:
+            for b in a.get('systems', []):
+                for c in b.get('data_sets', []):
+                    for v in c.get('variables', []):
+                        if v.get('units') is not None:
+                            units.add((v['variable_name'], v['units']))
+    return units
+
+def build_conversion_table(files):
+    # Make sure every plan is resolved with pint rather than with the current table
+    CL.precompiled_conversion_table = {}
+    CL.Clear_Conversion_Plan_Cache()
+
+    plans = {}
+    for prop_sym, original_units in sorted(find_units(files)):
+        units = CL.Get_DB_Units(original_units, prop_sym)
+        plan = CL.Compile_Conversion_Plan(original_units, units, prop_sym)
+        # Failed conversions are left out so they are still reported when they happen
+        if plan[3] == 'failed':
+            continue
+        plans[(original_units, units, prop_sym)] = plan
+        # Also store the plain conversion into the database units (used by Into_Desired_Units)
+        if plan[0] is not None and plan[2] != original_units:
+            try:
+                plans[(original_units, plan[2], None)] = CL.Compile_Conversion_Plan(original_units, plan[2], None)
+            except Exception:
+                pass
+
+    return {
+        'units_conversion_hash': CL.Get_Units_Conversion_Hash(),
+        'plans': [[k[0], k[1], k[2], p[0], p[1], p[2], p[3]] for k, p in plans.items()],
+    }
+
+if __name__ == '__main__':
+    files = sys.argv[1:]
+    if len(files) == 0:
+        files = ['Test.json'] + sorted(glob.glob('../../../output_examples/*.json'))
+    conversion_table = build_conversion_table(files)
+    # Write one plan per line so changes to the table are easy to review
+    with open(CL.conversion_table_json_file, 'w') as fp:
+        fp.write('{"units_conversion_hash": ' + json.dumps(conversion_table['units_conversion_hash']) + ',\n"plans": [\n')
+        fp.write(',\n'.join(json.dumps(plan) for plan in conversion_table['plans']))
+        fp.write('\n]}\n')
+    print(f"{len(conversion_table['plans'])} conversion plans written to {CL.conversion_table_json_file}")
@@ -0,0 +1,77 @@
+# This script builds record_schema.json, the schema trc_records.py generates its record classes from, out of
+# the commented description of the API output in output_format.txt. Every "key": line of the description
+# becomes a field of the object it is in, with its kind (scalar, object, mapping or array), its type and
+# whether it is Required or Optional (as given at the start of its comment). Objects whose keys are not
+# known in advance ("<string>": "<string>", i.e. the description of a specimen) become mappings.
+#
+# Run it from this folder whenever output_format.txt changes:
+#       python build_record_schema.py [output_format.txt]
+import re
+import sys
+import json
+
+field_line = re.compile(r'^"(\w+)"\s*:\s*(.*)$')
+mapping_line = re.compile(r'^"<string>"\s*:')
+
+def strip_comment(line):
+    # The description has no // inside of its strings, only in its comments
+    position = line.find('//')
+    if position == -1:
+        return [line.strip(), '']
+    return [line[:position].strip(), line[position+2:].strip()]
+
+def is_required(comment):
+    return comment.lower().startswith('required') and not comment.lower().startswith('required if')
+
+def scalar_type(text):
+    return text.rstrip(',').strip().replace('"', '')
+
+# Returns the schema of the main trunk object, which is an object node:
+#   {'kind': 'object', 'required': ..., 'fields': {key: node}}
+# where the other nodes are {'kind': 'scalar', 'type': '<integer>'}, {'kind': 'mapping'} and
+# {'kind': 'array', 'item': node}
+def parse_output_format(lines):
+    root = None
+    stack = []
+    for raw_line in lines:
+        line, comment = strip_comment(raw_line)
+        if line == '' or set(line) <= set('.'):
+            continue
+        top = stack[-1] if stack else None
+        field = field_line.match(line)
+        if field:
+            key, rest = field.groups()
+            if rest.startswith('{') and '}' not in rest:
+                node = {'kind': 'object', 'required': is_required(comment), 'fields': {}}
+                stack.append(node)
+            elif rest.startswith('['):
+                node = {'kind': 'array', 'required': is_required(comment), 'item': None}
+                stack.append(node)
+            else:
+                node = {'kind': 'scalar', 'required': is_required(comment), 'type': scalar_type(rest)}
+            top['fields'][key] = node
+        elif mapping_line.match(line):
+            top['kind'] = 'mapping'
+            top.pop('fields', None)
+        elif line[0] in '}]':
+            stack.pop()
+        elif line.startswith('{'):
+            if line.rstrip(',') in ('{}', '{...}'):
+                continue
+            node = {'kind': 'object', 'required': True, 'fields': {}}
+            if top is None:
+                root = node
+            elif top['item'] is None:
+                top['item'] = node
+            stack.append(node)
+        elif top is not None and top['kind'] == 'array' and top['item'] is None:
+            top['item'] = {'kind': 'scalar', 'required': True, 'type': scalar_type(line)}
+    return root
+
+if __name__ == '__main__':
+    path = sys.argv[1] if len(sys.argv) > 1 else '../../../output_examples/output_format.txt'
+    with open(path, encoding='utf-8') as format_file:
+        schema = parse_output_format(format_file)
+    with open('record_schema.json', 'w') as schema_file:
+        json.dump(schema, schema_file, indent=1)
+    print(f"record_schema.json written from {path}")
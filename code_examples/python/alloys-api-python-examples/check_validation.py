@@ -0,0 +1,40 @@
+# This script checks that the batch validation of ValidationLibrary gives the same result whether a property code
+# is given in upper case (i.e. 'HRT') or in lower case (i.e. 'hrt', as in the corpus), and that it agrees with the
+# Validate_ function of the property. For every property it validates values below, inside and above the bounds
+# of the validation_bounds table (in database units) with Batch_Validation and Check_Bounds, and the signs of the
+# string_validation_functions properties with Batch_Validation. It prints the properties that differ and exits
+# with 1 if there are any.
+# Run it from this folder:
+#       python check_validation.py
+import sys
+import numpy as np
+import ConversionLibrary as CL
+import ValidationLibrary as VL
+from measurement import Measurement
+
+def sample_values(lower_bound, upper_bound):
+    span = max(abs(lower_bound), abs(upper_bound), 1.0)
+    return [lower_bound-span, (lower_bound+upper_bound)/2, upper_bound+span, np.nan]
+
+if __name__ == '__main__':
+    different = []
+    for prop_sym, function in VL.validation_functions.items():
+        if prop_sym in VL.string_validation_functions:
+            values = ['+', '-', 'x']
+            units = ''
+            results = [VL.Batch_Validation(code, values, units)[1] for code in (prop_sym, prop_sym.lower())]
+        else:
+            db_prop_sym, lower_bound, upper_bound, inclusive, is_int = VL.validation_bounds[prop_sym]
+            values = sample_values(lower_bound, upper_bound)
+            units = CL.Get_Units_Standard().get(db_prop_sym.upper(), 'None')
+            results = [VL.Batch_Validation(code, values, units)[1] for code in (prop_sym, prop_sym.lower())]
+            results += [VL.Check_Bounds(code, values)[1] for code in (prop_sym, prop_sym.lower())]
+            values = values[:-1]
+        # The Validate_ function of the property takes one value at a time
+        expected = np.array([function(Measurement(value, 0.0, units, prop_sym))[1] == 'True' for value in values])
+        if any((result != results[0]).any() for result in results) or ((results[0][:len(values)] == 0) != expected).any():
+            different.append(prop_sym)
+            print(f"{prop_sym:6} {[result.tolist() for result in results]} {expected.tolist()}")
+    print(f"{len(VL.validation_functions)} properties checked, {len(different)} different")
+    if different:
+        sys.exit(1)
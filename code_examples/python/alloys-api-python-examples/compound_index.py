@@ -0,0 +1,105 @@
+from heapq import merge
+
+# An index of the systems of a corpus by their compounds, to find systems by compound_ids the same way the
+# API's compound search does (see required_compounds, optional_compounds, excluded_compounds, required_or
+# and exclude_all in output_examples/input_format.txt) without going over every system of every citation.
+#   - Exact matches are looked up by the sorted tuple of the compound_ids, which matches the same systems as
+#     Counter(b['compound_ids']) == Counter(element_ids).
+#   - Every compound_id has the (ascending) list of the systems it is in, so the other queries only go over
+#     the lists of the compounds they ask for:
+#       index = CompoundSystemIndex()
+#       for a in data['TRC_data']:
+#           for b in a['systems']:
+#               index.add(a, b)
+#       index.exact([ti, ni])                                  # Ti-Ni systems
+#       index.superset([ni])                                   # every system containing Ni
+#       index.subset([ti, ni, al])                             # systems made of only Ti, Ni and Al
+#       index.search(required=[ti, ni], optional=[al], exclude_all=True)   # Ti-Ni with optional Al
+# Every query returns the (citation, system) pairs in the order they were added.
+
+class CompoundSystemIndex:
+    def __init__(self):
+        self.systems = [] # (citation, system) of every system added
+        self.sizes = [] # number of different compounds of every system
+        self.by_key = {} # sorted tuple of compound_ids -> [system number, ...]
+        self.postings = {} # compound_id -> [system number, ...]
+
+    # Adds a system (systems without a list of compound_ids are left out)
+    def add(self, a, b):
+        compound_ids = b.get('compound_ids')
+        if not isinstance(compound_ids, list):
+            return
+        number = len(self.systems)
+        self.systems.append((a, b))
+        compounds = set(compound_ids)
+        self.sizes.append(len(compounds))
+        self.by_key.setdefault(compound_key(compound_ids), []).append(number)
+        for compound_id in compounds:
+            self.postings.setdefault(compound_id, []).append(number)
+
+    def __len__(self):
+        return len(self.systems)
+
+    def _entries(self, numbers):
+        return [self.systems[number] for number in numbers]
+
+    # Systems made of exactly the compound_ids (as many times each)
+    def exact(self, compound_ids):
+        return self._entries(self.by_key.get(compound_key(compound_ids), []))
+
+    # Systems that contain every one of the compound_ids (and possibly others)
+    def superset(self, compound_ids):
+        return self._entries(self._superset_numbers(set(compound_ids)))
+
+    # Systems that contain at least one of the compound_ids
+    def any_of(self, compound_ids):
+        return self._entries(self._union_numbers(set(compound_ids)))
+
+    # Systems that contain nothing but (some of) the compound_ids
+    def subset(self, compound_ids):
+        return self._entries(self._subset_numbers(set(compound_ids)))
+
+    # The API's compound search done locally. A system is found if
+    #   - it contains all of the required compounds (any of them if required_or is True),
+    #   - it contains none of the excluded compounds,
+    #   - and, if exclude_all is True, it contains nothing but required and optional compounds.
+    def search(self, required=(), optional=(), excluded=(), required_or=False, exclude_all=False):
+        required = set(required)
+        if len(required) == 0:
+            numbers = range(len(self.systems))
+        elif required_or:
+            numbers = self._union_numbers(required)
+        else:
+            numbers = self._superset_numbers(required)
+        if exclude_all:
+            allowed = set(self._subset_numbers(required | set(optional)))
+            numbers = [number for number in numbers if number in allowed]
+        if len(excluded) > 0:
+            excluded = set(self._union_numbers(set(excluded)))
+            numbers = [number for number in numbers if number not in excluded]
+        return self._entries(numbers)
+
+    def _superset_numbers(self, compound_ids):
+        if len(compound_ids) == 0:
+            return list(range(len(self.systems)))
+        postings = sorted((self.postings.get(compound_id, []) for compound_id in compound_ids), key=len)
+        numbers = postings[0]
+        for posting in postings[1:]:
+            posting = set(posting)
+            numbers = [number for number in numbers if number in posting]
+        return numbers
+
+    def _union_numbers(self, compound_ids):
+        numbers = merge(*(self.postings.get(compound_id, []) for compound_id in compound_ids))
+        return list(dict.fromkeys(numbers))
+
+    def _subset_numbers(self, compound_ids):
+        counts = {}
+        for compound_id in compound_ids:
+            for number in self.postings.get(compound_id, []):
+                counts[number] = counts.get(number, 0) + 1
+        return sorted(number for number, count in counts.items() if count == self.sizes[number])
+
+# The canonical key of a list of compound_ids
+def compound_key(compound_ids):
+    return tuple(sorted(compound_ids))
@@ -0,0 +1,143 @@
+import os
+import json
+import hashlib
+import json_loader
+
+# Resolves compounds given as a formula_hill ("Cu"), a name ("copper"), a CAS number ("7440-50-8") or an
+# InChIKey to their compound_ids with dict lookups, instead of going over the compounds of every citation.
+# It is kept in compound_resolver.json (built by build_compound_resolver.py) and combines
+#   - the API's compound list (compoundlist, i.e. output_examples/compound_list.json), which has the formula
+#     and name of every compound in the database but not their ids. The resolver does not check the list when
+#     it is loaded, it is only replaced (if its hash changed) by update_compound_list, which
+#     build_compound_resolver.py calls, so run that script again when there is a new compound list
+#   - the compounds of the citations it has seen, which have the compound_id, names, CAS number and InChIKey
+#       resolver = CompoundResolver()
+#       element_ids = resolver.compound_ids(["Cu", "Sn"])
+#       element_ids = resolver.compound_ids(compound, citations=data['TRC_data'])   # only ids in the data, learns new ones
+#       element_ids = resolver.compound_ids(compound, citations=data['TRC_data'], save=True)   # and writes them to path
+# A formula can have more than one compound_id (i.e. "C" for graphite and diamond), so a list is returned.
+
+compound_resolver_json_file = os.path.dirname(os.path.realpath(__file__))+"/compound_resolver.json"
+
+class CompoundResolver:
+    def __init__(self, path=compound_resolver_json_file):
+        self.path = path
+        self.compound_list_hash = None
+        self.compound_list = [] # the entries of the compound list
+        self.compounds = {} # compound_id -> {'compound_id', 'formula_hill', 'names', 'cas_number', 'inchi_key'}
+        if path is not None and os.path.exists(path):
+            saved = json_loader.load_file(path)
+            self.compound_list_hash = saved['compound_list_hash']
+            self.compound_list = saved['compound_list']
+            self.compounds = {c['compound_id']: c for c in saved['compounds']}
+        self.build_lookups()
+
+    def build_lookups(self):
+        self.by_formula = {} # formula_hill -> [compound_id, ...]
+        self.by_key = {} # lower case name, CAS number without dashes or InChIKey -> [compound_id, ...]
+        self.formula_by_name = {} # lower case name -> formula from the compound list
+        self.list_formulas = set(c.get('compound_formula') for c in self.compound_list)
+        for c in self.compound_list:
+            if c.get('compound_name'):
+                self.formula_by_name.setdefault(c['compound_name'].lower(), c['compound_formula'])
+        for c in self.compounds.values():
+            self.add_lookups(c)
+
+    def add_lookups(self, c):
+        add_id(self.by_formula, c['formula_hill'], c['compound_id'])
+        for key in c['names'] + [c['cas_number'], c['inchi_key']]:
+            if key:
+                add_id(self.by_key, lookup_key(key), c['compound_id'])
+
+    def save(self):
+        with open(self.path, 'w') as resolver_file:
+            json.dump({
+                'compound_list_hash': self.compound_list_hash,
+                'compound_list': self.compound_list,
+                'compounds': sorted(self.compounds.values(), key=lambda c: c['compound_id']),
+            }, resolver_file)
+
+    # Takes the decoded compound list ({'compound_list': [...], ...}) and returns True if it changed
+    def update_compound_list(self, compound_list):
+        entries = compound_list.get('compound_list', [])
+        list_hash = hashlib.sha256(json.dumps(entries, sort_keys=True).encode('utf-8')).hexdigest()
+        if list_hash == self.compound_list_hash:
+            return False
+        self.compound_list_hash = list_hash
+        self.compound_list = entries
+        self.build_lookups()
+        return True
+
+    # Learns the compounds of the citations (their 'compounds' arrays). Returns the set of the compound_ids
+    # in them and whether any of them were new.
+    def add_citations(self, citations):
+        seen = set()
+        changed = False
+        for a in citations:
+            for c in a.get('compounds', []):
+                if 'compound_id' not in c:
+                    continue
+                seen.add(c['compound_id'])
+                if c['compound_id'] in self.compounds:
+                    continue
+                compound = {
+                    'compound_id': c['compound_id'],
+                    'formula_hill': c.get('formula_hill'),
+                    'names': [n['name'] for n in c.get('compound_name', []) if n.get('name')],
+                    'cas_number': c.get('cas_number'),
+                    'inchi_key': c.get('inchi_key'),
+                }
+                self.compounds[c['compound_id']] = compound
+                self.add_lookups(compound)
+                changed = True
+        return [seen, changed]
+
+    # The compound_ids of one compound given by its formula_hill, name, CAS number or InChIKey
+    def resolve(self, compound):
+        if compound in self.by_formula:
+            return list(self.by_formula[compound])
+        key = lookup_key(compound)
+        if key in self.by_key:
+            return list(self.by_key[key])
+        # A name which is only in the compound list is resolved through its formula
+        return list(self.by_formula.get(self.formula_by_name.get(compound.lower()), []))
+
+    # The formula_hill of a compound given by its name, CAS number or InChIKey (None if it is not known)
+    def formula(self, compound):
+        compound_ids = self.resolve(compound)
+        if compound_ids:
+            return self.compounds[compound_ids[0]]['formula_hill']
+        if compound.lower() in self.formula_by_name:
+            return self.formula_by_name[compound.lower()]
+        if compound in self.list_formulas:
+            return compound
+        return None
+
+    # The compound_ids of a list of compounds. If citations are given, only the compound_ids which are in their
+    # compounds are returned (the same ids as going over the compounds of every citation), and compounds which
+    # were not known yet are learned. They are only written to path if save is True, so the next time they are
+    # resolved without any citations.
+    def compound_ids(self, compounds, citations=None, save=False):
+        seen = None
+        if citations is not None:
+            seen, changed = self.add_citations(citations)
+            if save and changed and self.path is not None:
+                self.save()
+        element_ids = []
+        for c in compounds:
+            for compound_id in self.resolve(c):
+                if compound_id not in element_ids and (seen is None or compound_id in seen):
+                    element_ids.append(compound_id)
+        return element_ids
+
+def add_id(lookup, key, compound_id):
+    ids = lookup.setdefault(key, [])
+    if compound_id not in ids:
+        ids.append(compound_id)
+
+# Names and InChIKeys are looked up in lower case and CAS numbers without their dashes
+def lookup_key(text):
+    text = str(text).strip()
+    if text.replace('-', '').isdigit():
+        return text.replace('-', '')
+    return text.lower()
@@ -1,14 +1,22 @@
-def dataset_build(var, prop, element_ids, rep):
+def dataset_build(var, prop, element_ids, rep, normalize=False, citations=None, index=None, specimens=None):
+    # If normalize is True, temperature variables and properties are normalized to ITS-90 using the
+    # year of the citation and the temperature scale of the variable
+    # citations may be any iterable of TRC_data citations, i.e. trc_stream.iter_citations(open('Test.json'))
+    # so the response does not have to be loaded all at once. By default the citations of data are used.
+    # If an index (trc_index.TRCIndex) is given, only the systems made of the compounds are taken from it
+    # rather than scanning every system of every citation.
+    # specimens (specimen_index.SpecimenIndex) has the parents, descriptions and purities of the specimens,
+    # by default they are taken from the spec_par and spec_desc tables of the notebook.
 
-    import json
+    import json_loader
     # This loads the decoder table file into a dict for use within the code
-    with open('decoder_table.json') as json_file:
-        decoder_table = json.load(json_file)
+    decoder_table = json_loader.load_file('decoder_table.json')
     
     import pandas as pd
     import itertools
-    from conversion_bridge import conversion_bridge
-    from validation_bridge import validation_bridge
+    from pipeline import pipeline
+    from trc_records import iter_records
+    from specimen_index import SpecimenIndex
 
     temp_x = "N/A" # temporary value which houses variable ID for the variable
     temp_y = "N/A" # temporary value which houses variable ID for the property
@@ -23,158 +31,134 @@ def dataset_build(var, prop, element_ids, rep):
     num5 = 0
     num6 = 0
 
-    for a in data['TRC_data']:
-        for b in a['systems']: # system data tends to be the material compositions, so other aspects can vary within a system with each data set
-            try: # some intermetallics not explicitly recognized, so the try is to catch data sets which do not have a compound
-                # only enters if the metal or alloy is the same as listed, is not inclusive of all alloys that contain that element
-                if (Counter(b['compound_ids']) == Counter(element_ids)): 
-                    num3 += 1
-                    for p in b['phases']:
-                        state_dict[p['phase_id']] = p['type'] # this is where the ids and states are related to be called later
-                    for c in b['data_sets']:
-                        num5 += 1
-                        x_axt = []
-                        y_axt = []
-                        stat_id = []
-                        y_unc = []
-                        valid = []
-                        add_data = False
-                        method = ""
-                        for s in c['states']:
-                            stat_id.append(state_dict[s['phase_id']]) # recognizes and lists phase(s) for a given data point
-                            if s['specimen_id'] in spec_par: # this section is for listing recognizing the descriptions and purities of specimen
-                                if len(element_ids) > 1: # this is to go through the data if searching through an alloy
-                                    init_desc = []
-                                    pure = []
-                                    p_un = []
-                                    for t, u in itertools.zip_longest(spec_par[s['specimen_id']],range(len(element_ids)+1)):
-                                        if t == None:
-                                            temp_desc = t
-                                            init_desc.append(t)
-                                            pure.append(t)
-                                        else:
-                                            temp_desc = spec_desc[t]
-                                            init_desc.append(spec_desc[t])
-                                            temp_pure = ""
-                                            for i in temp_desc:
-                                                if i.isdigit() or i == ".":
-                                                    temp_pure = temp_pure + str(i)
-                                            if "." in temp_pure:
-                                                pure.append(float(temp_pure))
-                                            elif temp_pure == '' or temp_pure == None:
-                                                temp_pure = None
-                                                pure.append(temp_pure)
-                                            else:
-                                                pure.append(int(temp_pure))
-                                        if (temp_desc == None) or (temp_pure == None):
-                                            p_un.append(None)
-                                        elif 'weight %' in temp_desc:
-                                            p_un.append('Weight %')
-                                        elif 'mole %' in temp_desc:
-                                            p_un.append('Mole %')
-                                        else:
-                                            p_un.append("Not Specified %")
-                                else: # this is for identifyig description and purity if a pure element
-                                    init_desc = spec_desc[spec_par[s['specimen_id']][0]]
-                                    pure = ""
-                                    for i in init_desc:
-                                        if i.isdigit() or i == ".":
-                                            pure = pure + str(i)
-                                    if "." in pure:
-                                        pure = float(pure)
-                                    elif pure == '':
-                                        pure = None
-                                    else:
-                                        pure = int(pure)
-                                    if 'weight %' in init_desc:
-                                        p_un = 'Weight %'
-                                    elif 'mole %' in init_desc:
-                                        p_un = 'Mole %'
-                                    elif pure == None:
-                                        p_un = None
+    if citations is None and index is None:
+        citations = data['TRC_data']
+    if specimens is None:
+        specimens = SpecimenIndex.from_tables(spec_par, spec_desc)
+    specimen_parents = specimens.parent_table(element_ids) # specimen_id -> parent_ids of the specimens of the compounds
+    def citation_systems():
+        for a in iter_records(citations): # typed records, so the structure is checked with attributes and sets rather than str()
+            for b in a['systems']: # system data tends to be the material compositions, so other aspects can vary within a system with each data set
+                yield a, b
+
+    for a, b in (citation_systems() if index is None else index.compound_systems(element_ids)):
+        try: # some intermetallics not explicitly recognized, so the try is to catch data sets which do not have a compound
+            # only enters if the metal or alloy is the same as listed, is not inclusive of all alloys that contain that element
+            if (Counter(b['compound_ids']) == Counter(element_ids)): 
+                num3 += 1
+                for p in b['phases']:
+                    state_dict[p['phase_id']] = p['type'] # this is where the ids and states are related to be called later
+                for c in b['data_sets']:
+                    num5 += 1
+                    x_axt = []
+                    y_axt = []
+                    stat_id = []
+                    y_unc = []
+                    valid = []
+                    add_data = False
+                    method = ""
+                    for s in c['states']:
+                        stat_id.append(state_dict[s['phase_id']]) # recognizes and lists phase(s) for a given data point
+                        if s['specimen_id'] in specimen_parents: # this section is for listing recognizing the descriptions and purities of specimen
+                            if len(element_ids) > 1: # this is to go through the data if searching through an alloy
+                                init_desc = []
+                                pure = []
+                                p_un = []
+                                for t, u in itertools.zip_longest(specimen_parents[s['specimen_id']],range(len(element_ids)+1)):
+                                    if t == None:
+                                        init_desc.append(t)
+                                        pure.append(t)
+                                        p_un.append(None)
                                     else:
-                                        p_un = "Not Specified %"
-                            else: # lists specimen ID for easy recognition if it was not properly added to the spec_par dict
-                                init_desc = s['specimen_id'] 
-                                num6 += 1
-                        for v in c['variables']: # this section of the code is designated to identifying the variable and property for use currently
-                            if v['variable_name'] == prop:
-                                num1 += 1
-                                temp_y = v['variable_id']
-                                rep_u = v['representation']
-                                if (str(rep)[0] == 'R') or (str(rep)[0] == 'X'):
-                                    y_un = '1'
+                                        temp_desc, temp_pure, basis = specimens.purity(t) # parsed once per specimen
+                                        init_desc.append(temp_desc)
+                                        pure.append(temp_pure)
+                                        p_un.append(None if temp_pure == None else basis)
+                            else: # this is for identifyig description and purity if a pure element
+                                init_desc, pure, p_un = specimens.purity(specimen_parents[s['specimen_id']][0])
+                                if p_un == "Not Specified %" and pure == None:
+                                    p_un = None
+                        else: # lists specimen ID for easy recognition if it was not properly added to the spec_par dict
+                            init_desc = s['specimen_id'] 
+                            num6 += 1
+                    for v in c['variables']: # this section of the code is designated to identifying the variable and property for use currently
+                        if v['variable_name'] == prop:
+                            num1 += 1
+                            temp_y = v['variable_id']
+                            rep_u = v['representation']
+                            y_scale = v.get('temperature_scale', '')
+                            if (str(rep)[0] == 'R') or (str(rep)[0] == 'X'):
+                                y_un = '1'
+                            else:
+                                y_un = v['units']
+                            if 'method' in v:
+                                if str(v['method']).upper() in decoder_table['Method']:
+                                    method = decoder_table['Method'][v['method'].upper()]
                                 else:
-                                    y_un = v['units']
-                                if 'method' in str(v):
-                                    if str(v['method']).upper() in str(decoder_table['Method']):
-                                        method = decoder_table['Method'][v['method'].upper()]
+                                    method = v['method']
+                            else:
+                                method = "N/A"
+                            if 'reference_temperature' in v:
+                                ref_temp = v['reference_temperature']
+                            else:
+                                ref_temp = "N/A"
+                        if v['variable_name'] == var:
+                            num2 += 1
+                            temp_x = v['variable_id']
+                            x_scale = v.get('temperature_scale', '')
+                            if v['units'] == 'D':
+                                x_un = decoder_table['UnitsSpecial'][v['units']]
+                            else:
+                                x_un = v['units']
+                    for d in c['data']: # goes through data tables and eventially data values
+                        if (temp_x in c.variable_ids) and (temp_y in c.variable_ids): # only enters if both property and variable are compatible
+                            if d['variable_id'] == temp_y:
+                                # the whole property column is converted, normalized and validated in one pass
+                                temp_data_y = pipeline([e['value'] for e in d['data_values']], [e['uncertainty'] if 'uncertainty' in e else 0 for e in d['data_values']],
+                                                       prop, y_un, des_un_prop, rep, a['citation']['year'], y_scale, normalize)
+                                for e, y, u, ok in zip(d['data_values'], temp_data_y[0].tolist(), temp_data_y[1].tolist(), temp_data_y[3]):
+                                    if e['value'] == None:
+                                        y_axt.append(None)
+                                        y_unc.append(None)
+                                        valid.append(None)
                                     else:
-                                        method = v['method']
-                                else:
-                                    method = "N/A"
-                                if "'reference_temperature':" in str(v):
-                                    ref_temp = v['reference_temperature']
-                                else:
-                                    ref_temp = "N/A"
-                            if v['variable_name'] == var:
-                                num2 += 1
-                                temp_x = v['variable_id']
-                                if v['units'] == 'D':
-                                    x_un = decoder_table['UnitsSpecial'][v['units']]
-                                else:
-                                    x_un = v['units']
-                        for d in c['data']: # goes through data tables and eventially data values
-                            if (f"'variable_id': {temp_x}" in str(c['data'])) and (f"'variable_id': {temp_y}" in str(c['data'])): # only enters if both property and variable are compatible
-                                if d['variable_id'] == temp_y:
-                                    for e in d['data_values']:
-                                        if e['value'] == None:
-                                            y_axt.append(None)
-                                            y_unc.append(None)
-                                            valid.append(None)
+                                        y_axt.append(y)
+                                        if 'uncertainty' in e: # adds the uncertainty value for use in the data framework
+                                            y_unc.append(u)
                                         else:
-                                            if "'uncertainty':" in str(e): # adds the uncertainty value for use in the data framework
-                                                temp_data_y = conversion_bridge(e['value'], e['uncertainty'], prop, y_un, des_un_prop)
-                                                verify = validation_bridge(temp_data_y[1], prop, y_un, rep)
-                                                y_axt.append(temp_data_y[1])
-                                                y_unc.append(temp_data_y[2])
-                                                valid.append(verify[0][1])
-                                            else:
-                                                temp_data_y = conversion_bridge(e['value'], 0, prop, y_un, des_un_prop)
-                                                verify = validation_bridge(temp_data_y[1], prop, y_un, rep)
-                                                y_axt.append(temp_data_y[1])
-                                                y_unc.append(None)
-                                                valid.append(verify[0][1])
-                                if d['variable_id'] == temp_x:
-                                    for f in d['data_values']:
-                                        temp_data_x = conversion_bridge(f['value'], 0, var, x_un, des_un_var)
-                                        x_axt.append(temp_data_x[1]) # these are the data values for the variable being added to the framework
-                                add_data = True # adds a check to make sure that the table knows to add current data set
-                                num4 += 1
-                        if add_data == True:
-                            for i,j,k,l in itertools.zip_longest(x_axt,y_axt,y_unc,valid):
-                                if i == None:
-                                    i = x_axt[0]
-                                    # These are all of the individual and varying aspects being added to the pandas framework, not all are currently
-                                    # used but are present for use if wanted.
-                                dataset.append({ 
-                                    f'{x_lab}: {des_un_var}': i, # x-axis variable values
-                                    f'{y_lab}: {des_un_prop}': j, # y-axis property values
-                                    'Uncertainty': k, # uncertainty for property
-                                    'Ref Temp': ref_temp, # reference temperature for relative values (K)
-                                    'Data Set ID': str(c['data_set_id']), # Data Set ID for which each value belongs to
-                                    'State': stat_id, # encoded state(s) for each point
-                                    'Representation': rep_u, # encoded representation for each point
-                                    'Method': method, # method for which data was collected
-                                    'Description': init_desc, # initial description of data
-                                    'Purity': pure, # purity value for alloys, in list structure [Purity Element 1, Purity Element 2, ..., Purity Alloy]
-                                    'Purity Units': p_un, # format for purity, corresponds directly to each purity value i.e. weight percent, molar percent, not specified
-                                    'Year': a['citation']['year'], # year of paper's publication
-                                    'Valid': l
-                                })
-            except KeyError:
-                #print(a['citation'])
-                continue
+                                            y_unc.append(None)
+                                        valid.append('True' if ok else 'False')
+                            if d['variable_id'] == temp_x:
+                                temp_data_x = pipeline([f['value'] for f in d['data_values']], 0, var, x_un, des_un_var,
+                                                       year=a['citation']['year'], temperature_scale=x_scale, normalize=normalize, validate=False)
+                                for f, x in zip(d['data_values'], temp_data_x[0].tolist()):
+                                    x_axt.append(None if f['value'] == None else x) # these are the data values for the variable being added to the framework
+                            add_data = True # adds a check to make sure that the table knows to add current data set
+                            num4 += 1
+                    if add_data == True:
+                        for i,j,k,l in itertools.zip_longest(x_axt,y_axt,y_unc,valid):
+                            if i == None:
+                                i = x_axt[0]
+                                # These are all of the individual and varying aspects being added to the pandas framework, not all are currently
+                                # used but are present for use if wanted.
+                            dataset.append({ 
+                                f'{x_lab}: {des_un_var}': i, # x-axis variable values
+                                f'{y_lab}: {des_un_prop}': j, # y-axis property values
+                                'Uncertainty': k, # uncertainty for property
+                                'Ref Temp': ref_temp, # reference temperature for relative values (K)
+                                'Data Set ID': str(c['data_set_id']), # Data Set ID for which each value belongs to
+                                'State': stat_id, # encoded state(s) for each point
+                                'Representation': rep_u, # encoded representation for each point
+                                'Method': method, # method for which data was collected
+                                'Description': init_desc, # initial description of data
+                                'Purity': pure, # purity value for alloys, in list structure [Purity Element 1, Purity Element 2, ..., Purity Alloy]
+                                'Purity Units': p_un, # format for purity, corresponds directly to each purity value i.e. weight percent, molar percent, not specified
+                                'Year': a['citation']['year'], # year of paper's publication
+                                'Valid': l
+                            })
+        except KeyError:
+            #print(a['citation'])
+            continue
 
     print(num3, num1, num2, num4, num5, num6)
     df = pd.DataFrame(dataset) # builds the pandas dataframe
\ No newline at end of file
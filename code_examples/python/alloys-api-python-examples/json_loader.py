@@ -0,0 +1,55 @@
+import os
+import json
+
+# The one place JSON files and API responses are decoded. A faster decoder is used when one is installed:
+#       orjson  (pip install orjson)
+#       msgspec (pip install msgspec)
+# and the standard library json module otherwise. They all decode to the same python objects (see
+# benchmark_json.py), and anything a fast decoder does not accept (i.e. NaN or integers larger than
+# 64 bits) is decoded again with the json module, so the results and errors are the same as json.load.
+# Set the TRC_JSON_BACKEND environment variable to 'orjson', 'msgspec' or 'json' to choose the backend.
+
+def load_json_backends():
+    backends = {}
+    try:
+        import orjson
+        backends['orjson'] = orjson.loads
+    except ImportError:
+        pass
+    try:
+        import msgspec
+        backends['msgspec'] = msgspec.json.decode
+    except ImportError:
+        pass
+    backends['json'] = json.loads
+    return backends
+
+json_backends = load_json_backends()
+
+# Chooses the backend used by loads, load and load_file. Raises a ValueError if it is not installed.
+def set_json_backend(name):
+    global json_backend, json_decode
+    if name not in json_backends:
+        raise ValueError(f"JSON backend {name!r} is not installed, use one of {list(json_backends)}")
+    json_backend = name
+    json_decode = json_backends[name]
+
+set_json_backend(os.environ.get('TRC_JSON_BACKEND', next(iter(json_backends))))
+
+# Decodes a str or bytes JSON document
+def loads(data):
+    if json_decode is json.loads:
+        return json.loads(data)
+    try:
+        return json_decode(data)
+    except Exception:
+        return json.loads(data)
+
+# Decodes an open JSON file, text or binary
+def load(fp):
+    return loads(fp.read())
+
+# Decodes the JSON file at path. The file is read as bytes so it does not need to be decoded twice.
+def load_file(path):
+    with open(path, 'rb') as json_file:
+        return loads(json_file.read())
@@ -0,0 +1,43 @@
+# A Measurement is a compact record of one numeric data value (or a whole NumPy column of values that
+# share the same units) along with its uncertainty, units, property symbol and representation.
+# The Conversion, Validation and Normalization libraries accept a Measurement anywhere they accept the
+# 7 string tuple used by the C++ rules engine:
+#       (bool_value,int_value,long_value,float_value,string_value,variable_name,variable_units)
+# where the float_value is the string "value,uncertainty". Passing a Measurement instead means the value
+# does not need to be formatted into a string and parsed back out again by every function it goes through.
+# Use Measurement.from_tuple and to_tuple to go between the two forms.
+class Measurement:
+    __slots__ = ('value', 'uncertainty', 'units', 'prop', 'representation')
+
+    def __init__(self, value, uncertainty=0.0, units='', prop='', representation=''):
+        self.value = value
+        self.uncertainty = uncertainty
+        self.units = units
+        self.prop = prop
+        self.representation = representation
+
+    # Builds a Measurement from the tuple passed by the C++ rules engine. The uncertainty is 0 if
+    # the tuple does not have one. Non numeric values (i.e. strings) are kept as they are.
+    @classmethod
+    def from_tuple(cls, tuple0, representation=''):
+        if tuple0[3] != '':
+            float_value_list = tuple0[3].split(',')
+            value = float(float_value_list[0])
+            uncertainty = float(float_value_list[1]) if len(float_value_list) > 1 else 0.0
+        elif tuple0[1] != '' or tuple0[2] != '':
+            int_value_list = (tuple0[1] if tuple0[1] != '' else tuple0[2]).split(',')
+            value = int(float(int_value_list[0]))
+            uncertainty = float(int_value_list[1]) if len(int_value_list) > 1 else 0.0
+        else:
+            value = tuple0[4] if tuple0[4] != '' else tuple0[0]
+            uncertainty = 0.0
+        return cls(value, uncertainty, tuple0[6], tuple0[5], representation)
+
+    # Returns the tuple form of the Measurement for the C++ rules engine
+    def to_tuple(self):
+        if isinstance(self.value, str):
+            return ("", "", "", "", self.value, self.prop, self.units)
+        return ("", "", "", f"{self.value},{self.uncertainty}", "", self.prop, self.units)
+
+    def __repr__(self):
+        return f"Measurement({self.value!r}, {self.uncertainty!r}, {self.units!r}, {self.prop!r}, {self.representation!r})"
@@ -0,0 +1,91 @@
+import numpy as np
+import ConversionLibrary as CL
+import ValidationLibrary as VL
+import NormalizationLibrary as NL
+
+# The value as a float (NaN for missing values) and whether it is not a number at all
+def as_number(val):
+    if val is None:
+        return [np.nan, False]
+    try:
+        return [float(val), False]
+    except (TypeError, ValueError):
+        return [np.nan, True]
+
+# The fused conversion, normalization and validation stage for one column of a data set, i.e. every value
+# of one variable or property of a data set. The values all share the same units, so instead of converting
+# each value into the desired units with conversion_bridge and then converting it again into database units
+# in validation_bridge, the whole column is:
+#   1. converted into database units once,
+#   2. normalized to ITS-90 if normalize is True and the database units are K (this needs the year of the
+#      citation and/or the temperature scale of the variable),
+#   3. validated against the database unit bounds of the validation_bounds table (see ValidationLibrary),
+#   4. converted from database units into out_unit, the units the user wants to see. If out_unit is None
+#      the values are left in database units.
+# values may hold None for missing values and uncertainties may be a single number for the whole column.
+# Values that are not numbers (other than the signs of the HRTS and PRTS properties) fail with reason code 7.
+# Returns a list of [values, uncertainties, units, mask, reasons] where mask is True for the values that pass
+# the validation and reasons holds the reason code of each value (see VL.validation_reasons).
+# If validate is False every value passes with reason code 0.
+def pipeline(values, uncertainties, var, in_unit, out_unit=None, rep='', year=None, temperature_scale='', normalize=False, validate=True):
+    # The property codes of the corpus may be lower case (i.e. 'hrt'), but the validation tables are upper case
+    var = var.upper()
+    # The heating and pressurizing rate signs are strings, so they are validated one value at a time
+    if var in VL.string_validation_functions:
+        if validate:
+            mask, reasons = VL.Batch_Validation(var, values, in_unit, rep)
+        else:
+            reasons = np.zeros(len(values), dtype=np.int8)
+            mask = reasons == 0
+        uncertainties = np.broadcast_to(np.asarray(uncertainties, dtype=float), mask.shape)
+        return [np.array(values, dtype=object), uncertainties, in_unit, mask, reasons]
+
+    try:
+        values = np.asarray(values, dtype=float)
+        invalid = None
+    except (TypeError, ValueError):
+        # Values that are not numbers are treated as missing values and fail with reason code 7 below
+        numbers = [as_number(val) for val in values]
+        values = np.array([number for number, is_invalid in numbers], dtype=float)
+        invalid = np.array([is_invalid for number, is_invalid in numbers], dtype=bool)
+    uncertainties = np.broadcast_to(np.asarray(uncertainties, dtype=float), values.shape)
+    if in_unit == '':
+        in_unit = 'None'
+
+    ### CONVERT TO DATABASE UNITS ###
+    prop_sym = VL.validation_bounds[var][0] if var in VL.validation_bounds else var
+    values_db, uncertainties_db, db_units = CL.Convert_To_DB_Units_Array(values, uncertainties, in_unit, prop_sym)
+    normalized = False
+
+    ### NORMALIZE ###
+    if normalize and db_units == 'K':
+        values_db = NL.Temperature_Array(values_db, uncertainties_db, 'K', year, temperature_scale)[0]
+        normalized = True
+
+    ### VALIDATE ###
+    if validate and (var in VL.validation_bounds) and VL.validation_bounds[var][4]:
+        # Integer values (i.e. the number of phases) are truncated before they are converted
+        mask, reasons = VL.Batch_Validation(var, values, in_unit, rep)
+    elif validate:
+        mask, reasons = VL.Check_Bounds(var, values_db, rep)
+        # Values that were there before the conversion but not after could not be converted
+        reasons[(reasons == 1) & ~np.isnan(values)] = 4
+        mask = reasons == 0
+    else:
+        reasons = np.zeros(values.shape, dtype=np.int8)
+        mask = reasons == 0
+    if validate and invalid is not None:
+        reasons[invalid & (reasons == 1)] = 7
+        mask = reasons == 0
+
+    ### CONVERT TO DESIRED UNITS ###
+    if out_unit is None:
+        return [values_db, uncertainties_db, db_units, mask, reasons]
+    if out_unit == in_unit and not normalized:
+        return [values, uncertainties, out_unit, mask, reasons]
+    if np.isnan(values_db).all() and not np.isnan(values).all():
+        # The values have no database units conversion, so convert them directly
+        converted = CL.Convert_Units_Array(values, uncertainties, in_unit, out_unit)
+    else:
+        converted = CL.Convert_Units_Array(values_db, uncertainties_db, db_units, out_unit)
+    return [converted[0], converted[1], converted[2], mask, reasons]
@@ -1,4 +1,5 @@
 from run_validation import run_validation
+import ConversionLibrary as CL
 import json
 import itertools
 import pandas as pd
@@ -68,4 +69,7 @@ with open('Error_Folder/all_errors.json', 'w') as fp:
 
 
 df = pd.DataFrame(err_tab)
-df.to_csv('Error_Folder/error_tab.csv', index = False)
\ No newline at end of file
+df.to_csv('Error_Folder/error_tab.csv', index = False)
+
+# Write out which conversion paths were used and which conversions failed during the run
+CL.Dump_Conversion_Telemetry('Error_Folder/conversion_telemetry.json')
\ No newline at end of file
@@ -1,25 +1,24 @@
-def run_validation(prop):
-    import json
-    import requests
-    headers = {
-        'content-type':'application/x-www-form-urlencoded;',
-        'Access-Control-Allow-Origin':'*',
-    }
+def run_validation(prop, index=None):
+    # If an index (trc_index.TRCIndex) of an already loaded corpus is given, the systems with the property are
+    # taken from it instead of requesting them from the API, so a sweep over many properties loads the data once
+    if index is None:
+        import requests
+        headers = {
+            'content-type':'application/x-www-form-urlencoded;',
+            'Access-Control-Allow-Origin':'*',
+        }
 
-    search_data = {"property_search_code":prop}
-    api_key = open('D:/Bryan/Desktop/NIST/TRC-Alloys API Key.txt').read()
-    url = f'http://trcsrv2.boulder.nist.gov/MetalsAlloyAPI/search?authkey={api_key}'
-    compound_data_response = requests.post(url, json=search_data, headers=headers)
-    import re
+        search_data = {"property_search_code":prop}
+        api_key = open('D:/Bryan/Desktop/NIST/TRC-Alloys API Key.txt').read()
+        url = f'http://trcsrv2.boulder.nist.gov/MetalsAlloyAPI/search?authkey={api_key}'
+        # The response is decoded as it comes in (with the non-ASCII characters stripped out) rather than
+        # being written to a file and read back, so many properties can be validated at the same time
+        compound_data_response = requests.post(url, json=search_data, headers=headers, stream=True)
 
-    with open('error_check.json', 'w') as fp:
-        fp.write((re.sub(r'[^\x00-\x7f]',r'', compound_data_response.text)))
-
-    with open('error_check.json') as json_file:
-        data = json.load(json_file)
-
-    from conversion_bridge import conversion_bridge
-    from validation_bridge import validation_bridge
+    from pipeline import pipeline
+    from trc_stream import iter_citations
+    from trc_records import iter_records
+    import ValidationLibrary as VL
 
     temp_y = "N/A" # temporary value which houses variable ID for the property
 
@@ -30,59 +29,64 @@ def run_validation(prop):
     data_vals = []
     err_mess = []
 
-    for a in data['TRC_data']:
-        for b in a['systems']: # system data tends to be the material compositions, so other aspects can vary within a system with each data set
-            try:
-                for c in b['data_sets']:
-                    for v in c['variables']: # this section of the code is designated to identifying the variable and property for use currently
-                        if v['variable_name'] == prop:
-                            temp_y = v['variable_id']
-                            rep_u = v['representation']
-                            if (str(rep_u)[0] == 'R') or (str(rep_u)[0] == 'X'):
-                                y_un = '1'
-                            else:
-                                y_un = v['units']
-                            if "'reference_temperature':" in str(v):
-                                ref_temp = v['reference_temperature']
-                            else:
-                                ref_temp = "N/A"
-                    for d in c['data']: # goes through data tables and eventially data values
-                        if (f"'variable_id': {temp_y}" in str(c['data'])): # only enters if both property and variable are compatible
-                            if d['variable_id'] == temp_y:
-                                for e in d['data_values']:
-                                    if e['value'] == None:
-                                        continue
-                                    else:
-                                        if "'uncertainty':" in str(e): # adds the uncertainty value for use in the data framework
-                                            # temp_data_y = conversion_bridge(e['value'], e['uncertainty'], prop, y_un, prop_un)
-                                            # verify = validation_bridge(temp_data_y[1], prop, y_un, rep_u)
-                                            verify = validation_bridge(e['value'], prop, y_un, rep_u)
-                                            if verify[0][1] == 'False':
-                                                if str(c['data_set_id']) not in valid:
-                                                    valid[str(c['data_set_id'])] = {}
-                                                valid[str(c['data_set_id'])][str(e['value'])] = verify[1]
-                                                props.append(prop)
-                                                data_id.append(str(c['data_set_id']))
-                                                cit_id.append(str(a['citation']['citation_id']))
-                                                data_vals.append(str(e['value']))
-                                                err_mess.append(verify[1])
+    def response_systems():
+        with compound_data_response:
+            for a in iter_records(iter_citations(compound_data_response, non_ascii='strip')): # reads one citation at a time rather than the whole response
+                for b in a['systems']: # system data tends to be the material compositions, so other aspects can vary within a system with each data set
+                    yield a, b
+
+    for a, b in (response_systems() if index is None else index.property_systems(prop)):
+        try:
+            for c in b['data_sets']:
+                for v in c['variables']: # this section of the code is designated to identifying the variable and property for use currently
+                    if v['variable_name'] == prop:
+                        temp_y = v['variable_id']
+                        rep_u = v['representation']
+                        if (str(rep_u)[0] == 'R') or (str(rep_u)[0] == 'X'):
+                            y_un = '1'
+                        else:
+                            y_un = v['units']
+                        if 'reference_temperature' in v:
+                            ref_temp = v['reference_temperature']
+                        else:
+                            ref_temp = "N/A"
+                for d in c['data']: # goes through data tables and eventially data values
+                    if temp_y in c.variable_ids: # only enters if both property and variable are compatible
+                        if d['variable_id'] == temp_y:
+                            # the whole property column is converted into database units and validated in one pass
+                            data_values = [e for e in d['data_values'] if e['value'] != None]
+                            verify = pipeline([e['value'] for e in data_values], [e['uncertainty'] if 'uncertainty' in e else 0 for e in data_values], prop, y_un, rep=rep_u)
+                            for e, reason in zip(data_values, verify[4]):
+                                if 'uncertainty' in e: # adds the uncertainty value for use in the data framework
+                                    if reason != 0:
+                                        if reason == 5 or reason == 6:
+                                            message = VL.validation_reasons[reason]
                                         else:
-                                            # temp_data_y = conversion_bridge(e['value'], 0, prop, y_un, prop_un)
-                                            if prop != 'NOP':
-                                                if str(c['data_set_id']) not in valid:
-                                                    valid[str(c['data_set_id'])] = {}
-                                                valid[str(c['data_set_id'])][str(e['value'])] = 'No Uncertainty for Value'
-                                                props.append(prop)
-                                                data_id.append(str(c['data_set_id']))
-                                                cit_id.append(str(a['citation']['citation_id']))
-                                                data_vals.append(str(e['value']))
-                                                err_mess.append('No Uncertainty for Value')
-            except KeyError:
-                valid[str(c['data_set_id'])] = 'SECTION MISSING'
-                props.append(prop)
-                data_id.append(str(c['data_set_id']))
-                cit_id.append(str(a['citation']['citation_id']))
-                data_vals.append('N/A')
-                err_mess.append('SECTION MISSING')
-                    
+                                            message = 'Value Out of Valid Range'
+                                        if str(c['data_set_id']) not in valid:
+                                            valid[str(c['data_set_id'])] = {}
+                                        valid[str(c['data_set_id'])][str(e['value'])] = message
+                                        props.append(prop)
+                                        data_id.append(str(c['data_set_id']))
+                                        cit_id.append(str(a['citation']['citation_id']))
+                                        data_vals.append(str(e['value']))
+                                        err_mess.append(message)
+                                else:
+                                    if prop != 'NOP':
+                                        if str(c['data_set_id']) not in valid:
+                                            valid[str(c['data_set_id'])] = {}
+                                        valid[str(c['data_set_id'])][str(e['value'])] = 'No Uncertainty for Value'
+                                        props.append(prop)
+                                        data_id.append(str(c['data_set_id']))
+                                        cit_id.append(str(a['citation']['citation_id']))
+                                        data_vals.append(str(e['value']))
+                                        err_mess.append('No Uncertainty for Value')
+        except KeyError:
+            valid[str(c['data_set_id'])] = 'SECTION MISSING'
+            props.append(prop)
+            data_id.append(str(c['data_set_id']))
+            cit_id.append(str(a['citation']['citation_id']))
+            data_vals.append('N/A')
+            err_mess.append('SECTION MISSING')
+            
     return(valid, props, data_id, cit_id, data_vals, err_mess)
\ No newline at end of file
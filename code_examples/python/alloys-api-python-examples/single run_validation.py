@@ -1,4 +1,5 @@
 import json
+import json_loader
 
 props = [
     'VDN', 'VDC', 'VS', 'VSC', 'VM', 'VEX', 'VC', 'VA', 'P', 'PP', 'PC', 'RSS', 'IST', 'IIT', 'NVK', 'NVC', 'T',
@@ -11,8 +12,7 @@ props = [
 all_errors = {}
 
 for a in props:
-    with open(f'Error_Folder/{a}_errors.json', 'r') as fp:
-        temp = json.load(fp)
+    temp = json_loader.load_file(f'Error_Folder/{a}_errors.json')
     all_errors[a] = temp
 
 with open(f'Error_Folder/all_errors.json', 'w') as fp:
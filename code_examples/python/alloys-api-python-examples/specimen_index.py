@@ -0,0 +1,89 @@
+from collections import deque
+
+# The specimens of a corpus, indexed once: the parent_ids of every specimen (and the whole lineage through
+# them), the initial description of every specimen and its purity, which is read from the description the
+# first time it is asked for and then kept, so building a data set looks the purity up instead of scanning
+# the description again for every row:
+#       specimens = SpecimenIndex(data['TRC_data'])
+#       spec_par = specimens.parent_table(element_ids)   # specimen_id -> parent_ids of the specimens of the compounds
+#       spec_desc = specimens.descriptions               # specimen_id -> initial description
+#       description, purity, basis = specimens.purity(specimen_id)   # basis is 'Weight %', 'Mole %' or 'Not Specified %'
+#       specimens.ancestors(specimen_id)                 # the parents, their parents and so on
+
+class SpecimenIndex:
+    def __init__(self, citations=()):
+        self.occurrences = [] # (specimen_id, set of compound_ids, parent_ids) of every specimen with parents
+        self.parents = {} # specimen_id -> parent_ids
+        self.descriptions = {} # specimen_id -> initial description
+        self.parent_tables = {} # frozenset of compound_ids -> parent table
+        self.purities = {} # specimen_id -> [description, purity, basis]
+        for a in citations:
+            for d in a.get('specimens', []):
+                self.add(d)
+
+    # Builds the index from the spec_par and spec_desc tables of the notebooks, parent_table then returns spec_par
+    @classmethod
+    def from_tables(cls, parents, descriptions):
+        specimens = cls()
+        specimens.parents = parents
+        specimens.descriptions = descriptions
+        specimens.occurrences = None
+        return specimens
+
+    def add(self, d):
+        if 'specimen_id' not in d:
+            return
+        if 'parent_ids' in d:
+            self.occurrences.append((d['specimen_id'], frozenset(d.get('compound_ids', [])), list(d['parent_ids'])))
+            self.parents[d['specimen_id']] = list(d['parent_ids'])
+        if 'description' in d and 'initial' in d['description']:
+            self.descriptions[d['specimen_id']] = f"{d['description']['initial']}"
+        self.parent_tables = {}
+        self.purities.pop(d['specimen_id'], None)
+
+    # specimen_id -> parent_ids of the specimens made of exactly the (different) compounds element_ids
+    def parent_table(self, element_ids):
+        if self.occurrences is None:
+            return self.parents
+        key = frozenset(element_ids)
+        if len(key) != len(element_ids):
+            return {}
+        if key not in self.parent_tables:
+            self.parent_tables[key] = {specimen_id: parent_ids for specimen_id, compounds, parent_ids in self.occurrences if compounds == key}
+        return self.parent_tables[key]
+
+    # [description, purity, basis] of a specimen, raises a KeyError if it has no description. The purity is the
+    # number made of the digits and points of the description (None if there are none) and the basis is
+    # 'Weight %' or 'Mole %' if the description says so and 'Not Specified %' otherwise.
+    def purity(self, specimen_id):
+        if specimen_id not in self.purities:
+            self.purities[specimen_id] = parse_purity(self.descriptions[specimen_id])
+        return self.purities[specimen_id]
+
+    # The ancestors of a specimen through its parent_ids, nearest first, each once
+    def ancestors(self, specimen_id):
+        found = []
+        queue = deque(self.parents.get(specimen_id, []))
+        while queue:
+            parent = queue.popleft()
+            if parent in found or parent == specimen_id:
+                continue
+            found.append(parent)
+            queue.extend(self.parents.get(parent, []))
+        return found
+
+def parse_purity(description):
+    digits = ''.join(i for i in description if i.isdigit() or i == ".")
+    if "." in digits:
+        purity = float(digits)
+    elif digits == '':
+        purity = None
+    else:
+        purity = int(digits)
+    if 'weight %' in description:
+        basis = 'Weight %'
+    elif 'mole %' in description:
+        basis = 'Mole %'
+    else:
+        basis = 'Not Specified %'
+    return [description, purity, basis]
@@ -0,0 +1,84 @@
+from trc_records import iter_records
+from compound_index import CompoundSystemIndex
+
+# An index of a loaded TRC_data corpus, built once so that every property and compound query of a session
+# only costs time in proportion to what it matches instead of a full scan of
+# TRC_data -> systems -> data_sets -> variables -> data:
+#       index = TRCIndex(data['TRC_data'])
+#       for a, b, c in index.property_data_sets('TMN'): ...     # (citation, system, data set) with a TMN variable
+#       for a, b in index.compound_systems([12, 40]): ...        # systems made of exactly these compounds
+#       index.compounds.search(required=[12], optional=[40], exclude_all=True)   # see compound_index.py
+#       a, b, c = index.data_set(471)
+#       a = index.citation(1331)
+# run_validation(prop, index=index) and dataset_build(..., index=index) use it in place of their scans.
+# Everything is returned in the order of the corpus and the citations are kept as trc_records records.
+
+class TRCIndex:
+    def __init__(self, citations=()):
+        self.citations = []
+        self.by_citation_id = {} # citation_id -> citation
+        self.by_data_set_id = {} # data_set_id -> (citation, system, data set)
+        self.by_property = {} # property (variable_name) code -> [(citation, system, data set), ...]
+        self.by_property_system = {} # property code -> [(citation, system), ...], each system once
+        self.compounds = CompoundSystemIndex() # systems by their compound_ids
+        for a in iter_records(citations):
+            self.add(a)
+
+    # Adds one citation to the index. Entries which are missing the keys the index is built on are left out.
+    def add(self, a):
+        self.citations.append(a)
+        if 'citation_id' in a.get('citation', {}):
+            self.by_citation_id.setdefault(a['citation']['citation_id'], a)
+        for b in a.get('systems', []):
+            self.compounds.add(a, b)
+            system_properties = set()
+            for c in b.get('data_sets', []):
+                if 'data_set_id' in c:
+                    self.by_data_set_id.setdefault(c['data_set_id'], (a, b, c))
+                data_set_properties = set()
+                for v in c.get('variables', []):
+                    prop = v.get('variable_name')
+                    if prop is not None and prop not in data_set_properties:
+                        data_set_properties.add(prop)
+                        self.by_property.setdefault(prop, []).append((a, b, c))
+                for prop in data_set_properties - system_properties:
+                    system_properties.add(prop)
+                    self.by_property_system.setdefault(prop, []).append((a, b))
+
+    def __len__(self):
+        return len(self.citations)
+
+    # The (citation, system, data set) of every data set with a variable named prop
+    def property_data_sets(self, prop):
+        return self.by_property.get(prop, [])
+
+    # The (citation, system) of every system with a data set with a variable named prop
+    def property_systems(self, prop):
+        return self.by_property_system.get(prop, [])
+
+    # The (citation, system) of every system made of exactly the compound_ids,
+    # the same as Counter(b['compound_ids']) == Counter(compound_ids)
+    def compound_systems(self, compound_ids):
+        return self.compounds.exact(compound_ids)
+
+    # The same systems grouped by citation, [(citation, [system, ...]), ...], for loops over citations and then systems
+    def compound_citations(self, compound_ids):
+        citations = []
+        for a, b in self.compound_systems(compound_ids):
+            if citations and citations[-1][0] is a:
+                citations[-1][1].append(b)
+            else:
+                citations.append((a, [b]))
+        return citations
+
+    # The (citation, system, data set) of a data set, raises a KeyError if it is not in the corpus
+    def data_set(self, data_set_id):
+        return self.by_data_set_id[data_set_id]
+
+    # The citation with the citation_id, raises a KeyError if it is not in the corpus
+    def citation(self, citation_id):
+        return self.by_citation_id[citation_id]
+
+    # The property codes in the corpus
+    def properties(self):
+        return list(self.by_property)
@@ -0,0 +1,163 @@
+import os
+import re
+import mmap
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+import json_loader
+from trc_stream import non_ascii_handlers
+
+# Loads large TRC_data responses (i.e. a full property dump saved to a file) on all cores. The TRC_data
+# array is a list of independent citation objects, so the raw bytes are first scanned for the commas that
+# separate the citations (with NumPy, a block at a time) and the citations are then split into chunks that
+# are decoded with json_loader in a process pool. The chunks are merged back in their original order, so
+#       data = load_trc_data_parallel('property_dump.json')
+# gives the same dict as json.load. Small documents (or processes=1) are decoded in this process.
+# map_citations_parallel runs a function on every citation in the workers and only sends back the results.
+#
+# On Windows (or anywhere processes are spawned rather than forked) call it from under
+#       if __name__ == '__main__':
+
+# Bytes per block scanned at a time, which bounds the memory used by the scan
+scan_block_size = 1 << 22
+# Documents smaller than this are not worth starting a process pool for
+parallel_min_size = 16 << 20
+
+trc_data_key = re.compile(rb'"TRC_data"\s*:\s*$')
+
+# How much the nesting depth changes at each character: +1 for { and [, -1 for } and ]
+depth_steps = np.zeros(256, dtype=np.int8)
+depth_steps[[ord('{'), ord('[')]] = 1
+depth_steps[[ord('}'), ord(']')]] = -1
+
+# Scans the raw bytes of a JSON document and returns [array_start, array_end, separators] where
+# array_start and array_end are the positions of the [ and ] of the TRC_data array and separators are
+# the positions of the commas between its citations. Returns None if there is no TRC_data array.
+def find_citation_boundaries(data):
+    size = len(data)
+    in_string = 0
+    depth = 0
+    backslash_run = 0
+    array_starts = []
+    array_ends = []
+    commas = []
+    for offset in range(0, size, scan_block_size):
+        block = np.frombuffer(data, dtype=np.uint8, count=min(scan_block_size, size-offset), offset=offset)
+        positions = np.flatnonzero((block == 34) | (block == 44) | (block == 91) | (block == 93) | (block == 123) | (block == 125))
+        characters = block[positions]
+        is_quote = characters == 34
+        backslashes = block == 92
+        # A quote is escaped if it comes after an odd number of backslashes (the run may start in the last block)
+        if backslash_run or backslashes.any():
+            quotes = positions[is_quote]
+            index = np.arange(len(block))
+            last_other = np.maximum.accumulate(np.where(backslashes, -1, index))
+            before = last_other[np.maximum(quotes-1, 0)]
+            run = np.where(before == -1, quotes+backslash_run, quotes-1-before)
+            run[quotes == 0] = backslash_run
+            is_quote[is_quote] = run % 2 == 0
+            backslash_run = len(block)-1-last_other[-1] if last_other[-1] != -1 else len(block)+backslash_run
+        # Characters after an odd number of quotes are inside a string
+        quote_count = np.cumsum(is_quote, dtype=np.int64)
+        outside = ((quote_count + in_string) & 1 == 0) & ~is_quote
+        depths = depth + np.cumsum(depth_steps[characters] * outside, dtype=np.int64)
+        array_starts.extend((positions[outside & (characters == 91) & (depths == 2)] + offset).tolist())
+        array_ends.extend((positions[outside & (characters == 93) & (depths == 1)] + offset).tolist())
+        commas.extend((positions[outside & (characters == 44) & (depths == 2)] + offset).tolist())
+        if len(positions):
+            in_string = int(quote_count[-1] + in_string) & 1
+            depth = int(depths[-1])
+
+    for array_start in array_starts:
+        if trc_data_key.search(bytes(data[max(array_start-64, 0):array_start])):
+            array_end = next(end for end in array_ends if end > array_start)
+            separators = [comma for comma in commas if array_start < comma < array_end]
+            return [array_start, array_end, separators]
+    return None
+
+# Decodes one chunk of citations. source is either the path of the file or the bytes of the chunk.
+# If function is given the list of function(citation) results is returned instead of the citations.
+def parse_citations(source, start, end, non_ascii='keep', function=None):
+    if isinstance(source, str):
+        with open(source, 'rb') as json_file:
+            json_file.seek(start)
+            chunk = json_file.read(end-start)
+    else:
+        chunk = source[start:end]
+    citations = parse_text(b'[' + chunk + b']', non_ascii)
+    if function is None:
+        return citations
+    return [function(citation) for citation in citations]
+
+def parse_text(data, non_ascii='keep'):
+    if non_ascii_handlers[non_ascii] is not None:
+        data = non_ascii_handlers[non_ascii](data.decode('utf-8'))
+    return json_loader.loads(data)
+
+# Loads the whole TRC_data document from a file path or bytes with up to processes worker processes
+# (by default one per core). non_ascii is handled the same as in trc_stream ('keep', 'strip' or 'transliterate').
+# Note that the decoded citations have to be sent back from the workers, which costs about as much as decoding
+# them with orjson, so this mostly helps with the json module backend. When the citations are only needed to
+# compute something from them, map_citations_parallel does that work in the workers as well.
+def load_trc_data_parallel(source, processes=None, non_ascii='keep', chunks_per_process=4):
+    return run_parallel(source, processes, non_ascii, chunks_per_process, None)
+
+# Returns the list of function(citation) for every citation of the TRC_data array in order, where the citations
+# are decoded and function is called in up to processes worker processes, so only the results are sent back. function must
+# be defined at the top level of a module (so it can be sent to the workers), i.e.
+#       def count_data_sets(a):
+#           return sum(len(b['data_sets']) for b in a['systems'])
+#       counts = list(map_citations_parallel('property_dump.json', count_data_sets))
+def map_citations_parallel(source, function, processes=None, non_ascii='keep', chunks_per_process=4):
+    return run_parallel(source, processes, non_ascii, chunks_per_process, function)
+
+def run_parallel(source, processes, non_ascii, chunks_per_process, function):
+    if non_ascii not in non_ascii_handlers:
+        raise ValueError(f"non_ascii must be one of {list(non_ascii_handlers)}, not {non_ascii!r}")
+    if processes is None:
+        processes = os.cpu_count() or 1
+    if isinstance(source, str):
+        with open(source, 'rb') as json_file:
+            if os.fstat(json_file.fileno()).st_size == 0:
+                return parse_text(b'', non_ascii)
+            with mmap.mmap(json_file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return run_chunks(source, data, processes, non_ascii, chunks_per_process, function)
+    return run_chunks(source, source, processes, non_ascii, chunks_per_process, function)
+
+def run_chunks(source, data, processes, non_ascii, chunks_per_process, function):
+    boundaries = None
+    if processes > 1 and len(data) >= parallel_min_size:
+        boundaries = find_citation_boundaries(data)
+    if boundaries is None:
+        document = parse_text(bytes(data), non_ascii)
+        if function is None:
+            return document
+        return [function(citation) for citation in document.get('TRC_data', [])]
+    array_start, array_end, separators = boundaries
+
+    # Split the citations into chunks of about the same number of bytes
+    starts = [array_start+1] + [comma+1 for comma in separators]
+    ends = separators + [array_end]
+    target = (array_end-array_start) / (processes*chunks_per_process)
+    chunks = []
+    chunk_start = starts[0]
+    for start, end in zip(starts, ends):
+        if end-chunk_start >= target or end == array_end:
+            chunks.append((chunk_start, end))
+            chunk_start = end+1
+
+    # Workers read their chunk of a file themselves, bytes are sent to them one chunk at a time
+    if isinstance(source, str):
+        sources = [source]*len(chunks)
+    else:
+        sources = [source[start:end] for start, end in chunks]
+        chunks = [(0, end-start) for start, end in chunks]
+    with ProcessPoolExecutor(max_workers=min(processes, len(chunks))) as executor:
+        parts = executor.map(parse_citations, sources, [c[0] for c in chunks], [c[1] for c in chunks],
+                             [non_ascii]*len(chunks), [function]*len(chunks))
+        results = [result for part in parts for result in part]
+    if function is not None:
+        return results
+    # Everything but the citations, i.e. number_of_citations, with an empty TRC_data array
+    document = parse_text(bytes(data[:array_start+1]) + bytes(data[array_end:]), non_ascii)
+    document['TRC_data'] = results
+    return document
@@ -0,0 +1,165 @@
+import os
+import json_loader
+
+# Typed records for the TRC_data objects, generated from record_schema.json (which build_record_schema.py
+# builds from output_format.txt). Every object of the description (citation, system, data set, variable,
+# data table, data value, ...) gets a class with one __slots__ attribute per field, so instead of testing the
+# structure of the decoded JSON by searching its str() for a key, the loops can use attribute and set checks:
+#       a = load_citation(a)
+#       for b in a.systems:
+#           for c in b.data_sets:
+#               if temp_y in c.variable_ids:          # the data set has a data table for variable temp_y
+#                   d = c.data_by_variable[temp_y]
+#               if 'reference_temperature' in v:      # the optional field is present
+#
+# Records can still be used like the dicts they were built from (a['systems'], 'method' in v, v.get('units'),
+# for key in v, len(v)), and a missing field raises a KeyError the same as a dict would. Fields that are not in
+# the description (i.e. the uncertainty_type of a data value) are kept in record.extra.
+
+record_schema_json_file = os.path.dirname(os.path.realpath(__file__))+"/record_schema.json"
+
+class Record:
+    __slots__ = ('present', 'order', 'extra')
+    fields = frozenset()
+    children = {}
+
+    def __getitem__(self, key):
+        if key in self.present:
+            return getattr(self, key) if key in self.fields else self.extra[key]
+        raise KeyError(key)
+
+    def __contains__(self, key):
+        return key in self.present
+
+    def __iter__(self):
+        return iter(self.order)
+
+    def __len__(self):
+        return len(self.order)
+
+    def get(self, key, default=None):
+        return self[key] if key in self.present else default
+
+    def keys(self):
+        return self.order
+
+    def items(self):
+        return [(key, self[key]) for key in self.order]
+
+    def __repr__(self):
+        return f"{type(self).__name__}({', '.join(f'{key}={self[key]!r}' for key in self.order)})"
+
+    # Returns the record as the dict it was built from
+    def to_dict(self):
+        return {key: to_plain(self[key]) for key in self.order}
+
+def to_plain(value):
+    if isinstance(value, Record):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [to_plain(item) for item in value]
+    return value
+
+# The (order, present) pair of every combination of keys seen, shared between the records that have it
+key_sets = {}
+
+def build_record(cls, values):
+    record = object.__new__(cls)
+    order = tuple(values)
+    if order not in key_sets:
+        key_sets[order] = (order, frozenset(order))
+    record.order, record.present = key_sets[order]
+    record.extra = None
+    for key, value in values.items():
+        if key in cls.children:
+            value = cls.children[key](value)
+        if key in cls.fields:
+            setattr(record, key, value)
+        else:
+            if record.extra is None:
+                record.extra = {}
+            record.extra[key] = value
+    if cls.index is not None:
+        cls.index(record)
+    return record
+
+# A data set also gets the set of the variable ids of its data tables and the data table of each variable id
+def index_data_set(record):
+    record.data_by_variable = {}
+    if 'data' in record.present and isinstance(record.data, list):
+        for d in record.data:
+            if isinstance(d, Record) and 'variable_id' in d.present:
+                record.data_by_variable.setdefault(d.variable_id, d)
+    record.variable_ids = frozenset(record.data_by_variable)
+
+# Derived attributes added to some of the records, by the path of their object in the description
+derived_attributes = {
+    'TRC_data.systems.data_sets': [('variable_ids', 'data_by_variable'), index_data_set],
+}
+
+def class_name(key, is_item):
+    name = ''.join(part[:1].upper()+part[1:] for part in key.split('_'))
+    if is_item and name.endswith('s'):
+        name = name[:-1]
+    return name
+
+# Returns the function that converts a value of the given schema node (a record, a list of records or as is)
+def make_converter(node, path, key, is_item=False):
+    if node is None:
+        return None
+    if node['kind'] == 'object':
+        cls = make_record_class(node, path, key, is_item)
+        return lambda value: build_record(cls, value) if isinstance(value, dict) else value
+    if node['kind'] == 'array':
+        convert = make_converter(node['item'], path, key, True)
+        if convert is None:
+            return None
+        return lambda value: [convert(item) for item in value] if isinstance(value, list) else value
+    return None
+
+def make_record_class(node, path, key, is_item):
+    attributes, index = derived_attributes.get(path, [(), None])
+    fields = list(node['fields'])
+    children = {}
+    for field, child in node['fields'].items():
+        convert = make_converter(child, f"{path}.{field}" if path else field, field)
+        if convert is not None:
+            children[field] = convert
+    cls = type(class_name(key, is_item), (Record,), {
+        '__slots__': tuple(fields) + tuple(attributes),
+        'fields': frozenset(fields),
+        'children': children,
+        'index': staticmethod(index) if index is not None else None,
+        'path': path,
+    })
+    record_classes[path] = cls
+    return cls
+
+# The generated record classes by the path of their object, i.e. record_classes['TRC_data.systems.data_sets']
+record_classes = {}
+Record.index = None
+build_document = make_converter(json_loader.load_file(record_schema_json_file), '', 'document')
+Citation = record_classes['TRC_data']
+System = record_classes['TRC_data.systems']
+DataSet = record_classes['TRC_data.systems.data_sets']
+Variable = record_classes['TRC_data.systems.data_sets.variables']
+Data = record_classes['TRC_data.systems.data_sets.data']
+DataValue = record_classes['TRC_data.systems.data_sets.data.data_values']
+Specimen = record_classes['TRC_data.specimens']
+
+# Returns the record of one element of the TRC_data array (records are returned as they are)
+def load_citation(a):
+    if isinstance(a, Record):
+        return a
+    return build_record(Citation, a)
+
+# Returns the record of a whole decoded document, i.e. load_document(json_loader.load_file('Test.json'))
+def load_document(document):
+    if isinstance(document, Record):
+        return document
+    return build_document(document)
+
+# Yields the records of any iterable of citations, i.e. iter_records(trc_stream.iter_citations(response))
+def iter_records(citations):
+    for a in citations:
+        yield load_citation(a)
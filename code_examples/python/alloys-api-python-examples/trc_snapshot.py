@@ -0,0 +1,339 @@
+import os
+import json
+import mmap
+import hashlib
+import numpy as np
+import json_loader
+
+# A binary snapshot of a TRC_data JSON file (i.e. Test.json) that can be reopened in milliseconds instead of
+# parsing the JSON again. The citations, systems, data sets, variables, data tables and data values are
+# flattened into tables of columns (one NumPy array per column) that are written one after the other into a
+# single file, which is memory-mapped when it is opened. Every column comes back as a zero-copy NumPy view
+# of the file, so i.e. the values of a data table are just a slice of the values column:
+#       snapshot = open_snapshot('Test.json')
+#       for i in snapshot.find_data('TMN'):
+#           values, uncertainties = snapshot.data_values(i)
+#
+# The snapshot is written next to the JSON file (Test.json.snapshot) and is rebuilt automatically by
+# open_snapshot when the sha256 hash of the JSON file changes (the hash is only computed again if the
+# size or modification time of the JSON file changed since the snapshot was written).
+#
+# Tables and their columns (all the row indices point into the other tables):
+#   citation:  id, year, systems_start, systems_end, json (the citation entry, its systems are in the system table)
+#   system:    id, citation, compounds_start, compounds_end, data_sets_start, data_sets_end, json
+#   compound:  id (the compound_ids of every system, one after the other)
+#   data_set:  id, system, citation, variables_start, variables_end, data_start, data_end, json
+#   variable:  id, data_set, name, units, json (the whole variable)
+#   data:      data_set, variable, values_start, values_end, json (one row per data table, variable is -1 if not found)
+#   value:     value, value_kind, text, uncertainty, uncertainty_kind, has_uncertainty_type, uncertainty_type (one row per data value)
+# The json, name, units, text and uncertainty_type columns are text columns stored as utf-8 bytes with offsets.
+
+snapshot_magic = b'TRCSNAP1'
+snapshot_alignment = 64
+
+# value_kind: what the 'value' of a data value was. Numbers are stored as float64, everything else as text.
+VALUE_NONE = 0
+VALUE_FLOAT = 1
+VALUE_INT = 2
+VALUE_TEXT = 3
+VALUE_JSON = 4
+# uncertainty_kind: whether a data value had an 'uncertainty' and what it was
+UNCERTAINTY_MISSING = 0
+UNCERTAINTY_FLOAT = 1
+UNCERTAINTY_INT = 2
+UNCERTAINTY_NONE = 3
+data_value_keys = {'uncertainty', 'uncertainty_type', 'value'}
+
+integer_columns = ['citation.id', 'citation.year', 'citation.systems_start', 'citation.systems_end',
+                   'system.id', 'system.citation', 'system.compounds_start', 'system.compounds_end', 'system.data_sets_start', 'system.data_sets_end',
+                   'compound.id',
+                   'data_set.id', 'data_set.system', 'data_set.citation', 'data_set.variables_start', 'data_set.variables_end', 'data_set.data_start', 'data_set.data_end',
+                   'variable.id', 'variable.data_set',
+                   'data.data_set', 'data.variable', 'data.values_start', 'data.values_end']
+float_columns = ['value.value', 'value.uncertainty']
+kind_columns = ['value.value_kind', 'value.uncertainty_kind', 'value.has_uncertainty_type']
+text_columns = ['citation.json', 'system.json', 'data_set.json', 'variable.name', 'variable.units', 'variable.json',
+                'data.json', 'value.text', 'value.uncertainty_type']
+
+def hash_file(path):
+    sha256 = hashlib.sha256()
+    with open(path, 'rb') as source_file:
+        for block in iter(lambda: source_file.read(1 << 20), b''):
+            sha256.update(block)
+    return sha256.hexdigest()
+
+# Collects the rows of a text column and turns them into [offsets, utf-8 bytes] arrays
+class _TextColumn:
+    def __init__(self):
+        self.parts = []
+        self.offsets = [0]
+
+    def append(self, text):
+        if text is None:
+            text = ''
+        data = text.encode('utf-8')
+        self.parts.append(data)
+        self.offsets.append(self.offsets[-1]+len(data))
+        return len(self.offsets)-2
+
+    def arrays(self):
+        return np.array(self.offsets, dtype=np.int64), np.frombuffer(b''.join(self.parts), dtype=np.uint8)
+
+# The JSON of an entry with its child lists (i.e. systems) left empty, they are stored in their own tables.
+# Keeping the empty lists keeps the order of the keys and tells entries without the key apart.
+def without_children(entry, *keys):
+    return json.dumps({k: [] if k in keys else v for k, v in entry.items()})
+
+# Splits a data value into [value, value_kind, text] so that the exact python value can be rebuilt.
+# Data values that are not made of a numeric value, a numeric uncertainty and an uncertainty_type are
+# stored whole as JSON.
+def split_value(data_value):
+    value = data_value.get('value')
+    if not data_value_keys.issuperset(data_value) or 'value' not in data_value or type(data_value.get('uncertainty')) not in (float, int, type(None)):
+        return [np.nan, VALUE_JSON, json.dumps(data_value)]
+    if value is None:
+        return [np.nan, VALUE_NONE, None]
+    if type(value) is float:
+        return [value, VALUE_FLOAT, None]
+    if type(value) is int and abs(value) < 2**53:
+        return [float(value), VALUE_INT, None]
+    if type(value) is str:
+        return [np.nan, VALUE_TEXT, value]
+    return [np.nan, VALUE_JSON, json.dumps(data_value)]
+
+# Flattens the decoded JSON document into the columns of the snapshot
+def flatten_document(document):
+    columns = {name: [] for name in integer_columns+float_columns+kind_columns}
+    texts = {name: _TextColumn() for name in text_columns}
+
+    for a in document.get('TRC_data', []):
+        citation_index = len(columns['citation.id'])
+        citation = a.get('citation') if isinstance(a.get('citation'), dict) else {}
+        columns['citation.id'].append(citation.get('citation_id', -1))
+        year = citation.get('year')
+        columns['citation.year'].append(year if type(year) is int else -1)
+        columns['citation.systems_start'].append(len(columns['system.id']))
+        texts['citation.json'].append(without_children(a, 'systems'))
+        for b in a.get('systems', []):
+            system_index = len(columns['system.id'])
+            columns['system.id'].append(b.get('system_id', -1))
+            columns['system.citation'].append(citation_index)
+            columns['system.compounds_start'].append(len(columns['compound.id']))
+            columns['compound.id'].extend(b.get('compound_ids', []))
+            columns['system.compounds_end'].append(len(columns['compound.id']))
+            columns['system.data_sets_start'].append(len(columns['data_set.id']))
+            texts['system.json'].append(without_children(b, 'data_sets'))
+            for c in b.get('data_sets', []):
+                data_set_index = len(columns['data_set.id'])
+                columns['data_set.id'].append(c.get('data_set_id', -1))
+                columns['data_set.system'].append(system_index)
+                columns['data_set.citation'].append(citation_index)
+                texts['data_set.json'].append(without_children(c, 'variables', 'data'))
+                columns['data_set.variables_start'].append(len(columns['variable.id']))
+                variable_rows = {}
+                for v in c.get('variables', []):
+                    variable_rows.setdefault(v.get('variable_id'), len(columns['variable.id']))
+                    columns['variable.id'].append(v.get('variable_id', -1))
+                    columns['variable.data_set'].append(data_set_index)
+                    texts['variable.name'].append(v.get('variable_name'))
+                    texts['variable.units'].append(v.get('units'))
+                    texts['variable.json'].append(json.dumps(v))
+                columns['data_set.variables_end'].append(len(columns['variable.id']))
+                columns['data_set.data_start'].append(len(columns['data.data_set']))
+                for d in c.get('data', []):
+                    columns['data.data_set'].append(data_set_index)
+                    columns['data.variable'].append(variable_rows.get(d.get('variable_id'), -1))
+                    columns['data.values_start'].append(len(columns['value.value']))
+                    texts['data.json'].append(without_children(d, 'data_values'))
+                    for e in d.get('data_values', []):
+                        value, value_kind, text = split_value(e)
+                        columns['value.value'].append(value)
+                        columns['value.value_kind'].append(value_kind)
+                        texts['value.text'].append(text)
+                        uncertainty = e.get('uncertainty')
+                        if value_kind == VALUE_JSON or 'uncertainty' not in e:
+                            columns['value.uncertainty'].append(np.nan)
+                            columns['value.uncertainty_kind'].append(UNCERTAINTY_MISSING)
+                        elif uncertainty is None:
+                            columns['value.uncertainty'].append(np.nan)
+                            columns['value.uncertainty_kind'].append(UNCERTAINTY_NONE)
+                        else:
+                            columns['value.uncertainty'].append(float(uncertainty))
+                            columns['value.uncertainty_kind'].append(UNCERTAINTY_INT if type(uncertainty) is int else UNCERTAINTY_FLOAT)
+                        columns['value.has_uncertainty_type'].append(value_kind != VALUE_JSON and 'uncertainty_type' in e)
+                        texts['value.uncertainty_type'].append(e.get('uncertainty_type') if value_kind != VALUE_JSON else None)
+                    columns['data.values_end'].append(len(columns['value.value']))
+                columns['data_set.data_end'].append(len(columns['data.data_set']))
+            columns['system.data_sets_end'].append(len(columns['data_set.id']))
+        columns['citation.systems_end'].append(len(columns['system.id']))
+
+    arrays = {}
+    for name, values in columns.items():
+        dtype = np.float64 if name in float_columns else np.uint8 if name in kind_columns else np.int64
+        arrays[name] = np.array(values, dtype=dtype)
+    for name, text in texts.items():
+        arrays[name+'.offsets'], arrays[name+'.bytes'] = text.arrays()
+    return arrays
+
+# Builds the snapshot of the JSON file source and writes it to path (by default source + '.snapshot').
+# The file is written under a temporary name and then renamed so readers never see a partial snapshot.
+def build_snapshot(source, path=None):
+    if path is None:
+        path = source + '.snapshot'
+    document = json_loader.load_file(source)
+    arrays = flatten_document(document)
+    status = os.stat(source)
+    header = {
+        'source_hash': hash_file(source),
+        'source_size': status.st_size,
+        'source_mtime_ns': status.st_mtime_ns,
+        # The other top level keys of the document, i.e. number_of_citations (TRC_data keeps its place)
+        'document': {k: [] if k == 'TRC_data' else v for k, v in document.items()},
+        'columns': {},
+    }
+    offset = 0
+    for name, array in arrays.items():
+        header['columns'][name] = [array.dtype.str, len(array), offset]
+        offset += -(-array.nbytes // snapshot_alignment) * snapshot_alignment
+    header_bytes = json.dumps(header).encode('utf-8')
+    data_start = -(-(len(snapshot_magic)+8+len(header_bytes)) // snapshot_alignment) * snapshot_alignment
+    temporary_path = f"{path}.{os.getpid()}.tmp"
+    with open(temporary_path, 'wb') as snapshot_file:
+        snapshot_file.write(snapshot_magic)
+        snapshot_file.write(len(header_bytes).to_bytes(8, 'little'))
+        snapshot_file.write(header_bytes)
+        for name, array in arrays.items():
+            snapshot_file.seek(data_start+header['columns'][name][2])
+            snapshot_file.write(array.tobytes())
+        snapshot_file.truncate(data_start+offset)
+    os.replace(temporary_path, path)
+    return path
+
+# Reads the header of a snapshot, returns None if it is not a snapshot
+def read_header(path):
+    try:
+        with open(path, 'rb') as snapshot_file:
+            if snapshot_file.read(len(snapshot_magic)) != snapshot_magic:
+                return None
+            size = int.from_bytes(snapshot_file.read(8), 'little')
+            return json.loads(snapshot_file.read(size))
+    except (OSError, ValueError):
+        return None
+
+# Returns True if the snapshot at path was built from the current contents of source
+def snapshot_is_current(source, path=None):
+    if path is None:
+        path = source + '.snapshot'
+    header = read_header(path)
+    if header is None:
+        return False
+    status = os.stat(source)
+    if status.st_size == header['source_size'] and status.st_mtime_ns == header['source_mtime_ns']:
+        return True
+    return hash_file(source) == header['source_hash']
+
+# Opens the snapshot of the JSON file source, building (or rebuilding) it first if it is missing or out of date
+def open_snapshot(source, path=None):
+    if path is None:
+        path = source + '.snapshot'
+    if not snapshot_is_current(source, path):
+        build_snapshot(source, path)
+    return TRCSnapshot(path)
+
+# A memory-mapped snapshot. snapshot.columns['value.value'] etc. are zero-copy NumPy views of the file.
+class TRCSnapshot:
+    def __init__(self, path):
+        header = read_header(path)
+        if header is None:
+            raise ValueError(f"{path} is not a TRC data snapshot")
+        self.path = path
+        self.document = header['document']
+        self.variable_names = None
+        with open(path, 'rb') as snapshot_file:
+            size = os.fstat(snapshot_file.fileno()).st_size
+            self.map = mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+        header_size = len(snapshot_magic)+8+int.from_bytes(self.map[len(snapshot_magic):len(snapshot_magic)+8], 'little')
+        data_start = -(-header_size // snapshot_alignment) * snapshot_alignment
+        self.columns = {name: np.frombuffer(self.map, dtype=np.dtype(dtype), count=count, offset=data_start+offset)
+                        for name, (dtype, count, offset) in header['columns'].items()}
+
+    def __len__(self):
+        return len(self.columns['citation.id'])
+
+    # Returns row i of a text column, i.e. snapshot.text('variable.name', 3)
+    def text(self, name, i):
+        offsets = self.columns[name+'.offsets']
+        return bytes(self.columns[name+'.bytes'][offsets[i]:offsets[i+1]]).decode('utf-8')
+
+    # Returns the rows of the data table whose variable is named variable_name (i.e. 'TMN')
+    def find_data(self, variable_name):
+        if self.variable_names is None:
+            self.variable_names = np.array([self.text('variable.name', i) for i in range(len(self.columns['variable.id']))], dtype=object)
+        variables = self.variable_names == variable_name
+        data_variables = self.columns['data.variable']
+        return np.flatnonzero((data_variables >= 0) & variables[np.maximum(data_variables, 0)])
+
+    # Returns [values, uncertainties] of row i of the data table as zero-copy views. Missing values
+    # (and text values such as the sign of a heating rate) are NaN.
+    def data_values(self, i):
+        start = self.columns['data.values_start'][i]
+        end = self.columns['data.values_end'][i]
+        return [self.columns['value.value'][start:end], self.columns['value.uncertainty'][start:end]]
+
+    # The following rebuild the decoded JSON objects, the same as json.load would give them
+    def value(self, i):
+        value_kind = self.columns['value.value_kind'][i]
+        if value_kind == VALUE_JSON:
+            return json.loads(self.text('value.text', i))
+        data_value = {}
+        uncertainty_kind = self.columns['value.uncertainty_kind'][i]
+        if uncertainty_kind == UNCERTAINTY_FLOAT:
+            data_value['uncertainty'] = float(self.columns['value.uncertainty'][i])
+        elif uncertainty_kind == UNCERTAINTY_INT:
+            data_value['uncertainty'] = int(self.columns['value.uncertainty'][i])
+        elif uncertainty_kind == UNCERTAINTY_NONE:
+            data_value['uncertainty'] = None
+        if self.columns['value.has_uncertainty_type'][i]:
+            data_value['uncertainty_type'] = self.text('value.uncertainty_type', i)
+        if value_kind == VALUE_NONE:
+            data_value['value'] = None
+        elif value_kind == VALUE_FLOAT:
+            data_value['value'] = float(self.columns['value.value'][i])
+        elif value_kind == VALUE_INT:
+            data_value['value'] = int(self.columns['value.value'][i])
+        else:
+            data_value['value'] = self.text('value.text', i)
+        return data_value
+
+    def data(self, i):
+        d = json.loads(self.text('data.json', i))
+        if 'data_values' in d:
+            d['data_values'] = [self.value(k) for k in range(self.columns['data.values_start'][i], self.columns['data.values_end'][i])]
+        return d
+
+    def data_set(self, i):
+        c = json.loads(self.text('data_set.json', i))
+        if 'variables' in c:
+            c['variables'] = [json.loads(self.text('variable.json', j)) for j in range(self.columns['data_set.variables_start'][i], self.columns['data_set.variables_end'][i])]
+        if 'data' in c:
+            c['data'] = [self.data(j) for j in range(self.columns['data_set.data_start'][i], self.columns['data_set.data_end'][i])]
+        return c
+
+    def system(self, i):
+        b = json.loads(self.text('system.json', i))
+        if 'data_sets' in b:
+            b['data_sets'] = [self.data_set(j) for j in range(self.columns['system.data_sets_start'][i], self.columns['system.data_sets_end'][i])]
+        return b
+
+    def citation(self, i):
+        a = json.loads(self.text('citation.json', i))
+        if 'systems' in a:
+            a['systems'] = [self.system(j) for j in range(self.columns['citation.systems_start'][i], self.columns['citation.systems_end'][i])]
+        return a
+
+    # Rebuilds the whole document, i.e. {'TRC_data': [...], 'number_of_citations': ...}
+    def to_document(self):
+        document = dict(self.document)
+        if 'TRC_data' in document:
+            document['TRC_data'] = [self.citation(i) for i in range(len(self))]
+        return document
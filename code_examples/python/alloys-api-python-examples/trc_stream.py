@@ -0,0 +1,156 @@
+import re
+import json
+import codecs
+import unicodedata
+import json_loader
+
+# Incremental readers for the TRC_data responses of the API (and files saved from them, i.e. Test.json).
+# A response is a single JSON object of the form
+#       {"TRC_data": [{"citation": {...}, "systems": [{..., "data_sets": [...]}, ...]}, ...], "number_of_citations": ...}
+# so json.load has to hold the whole document in memory before the first citation can be used. These readers
+# instead decode one element of the TRC_data array at a time as the text comes in, so memory stays at roughly
+# one citation no matter how large the response is.
+#
+# The source can be an open file (text or binary), a requests response opened with stream=True, or any
+# iterable of str/bytes chunks:
+#       with open('Test.json') as json_file:
+#           for citation, system, data_set in iter_data_sets(json_file):
+#               ...
+#       response = requests.post(url, json=search_data, headers=headers, stream=True)
+#       for a in iter_citations(response, non_ascii='strip'):
+#           ...
+# Use load_response to decode the whole response into a dict (like json.load) without a temporary file.
+# Nothing is written to disk, so any number of these can run at the same time.
+#
+# non_ascii sets what happens to non-ASCII characters in the text:
+#       'keep'          - they are kept (the default)
+#       'strip'         - they are removed, the same as re.sub(r'[^\x00-\x7f]', '', text)
+#       'transliterate' - accented letters become their plain ASCII letter (i.e. 'é' becomes 'e') and
+#                         any other non-ASCII characters are removed
+
+decoder = json.JSONDecoder()
+non_ascii_pattern = re.compile(r'[^\x00-\x7f]')
+
+def strip_non_ascii(text):
+    return non_ascii_pattern.sub('', text)
+
+def transliterate_non_ascii(text):
+    return unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('ascii')
+
+non_ascii_handlers = {
+    'keep': None,
+    'strip': strip_non_ascii,
+    'transliterate': transliterate_non_ascii,
+}
+
+# Holds the part of the text that has been read but not decoded yet
+class _Reader:
+    def __init__(self, source, chunk_size, non_ascii='keep'):
+        if non_ascii not in non_ascii_handlers:
+            raise ValueError(f"non_ascii must be one of {list(non_ascii_handlers)}, not {non_ascii!r}")
+        self.non_ascii = non_ascii_handlers[non_ascii]
+        if hasattr(source, 'iter_content'):
+            # requests response, iter_content also undoes any gzip content encoding
+            self.chunks = source.iter_content(chunk_size)
+        elif hasattr(source, 'read'):
+            self.chunks = iter(lambda: source.read(chunk_size), source.read(0))
+        else:
+            self.chunks = iter(source)
+        self.utf8 = codecs.getincrementaldecoder('utf-8')()
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+
+    # Reads at least as much text as is already pending so that retrying a partial decode
+    # costs linear rather than quadratic time for large citations. Returns False at the end of the source.
+    def read(self):
+        pending = len(self.buffer)-self.pos
+        chunks = [self.buffer[self.pos:]]
+        size = 0
+        while size == 0 or size < pending:
+            chunk = next(self.chunks, None)
+            if chunk is None:
+                chunk = self.utf8.decode(b'', final=True)
+                self.eof = True
+            elif isinstance(chunk, bytes):
+                chunk = self.utf8.decode(chunk)
+            # The UTF-8 decoder never splits a character, so each chunk can be handled on its own
+            if self.non_ascii is not None:
+                chunk = self.non_ascii(chunk)
+            chunks.append(chunk)
+            if self.eof:
+                break
+            size += len(chunk)
+        self.buffer = ''.join(chunks)
+        self.pos = 0
+        return size > 0
+
+    def peek(self):
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in ' \t\n\r':
+                self.pos += 1
+            if self.pos < len(self.buffer) or self.eof or not self.read():
+                break
+        return self.buffer[self.pos:self.pos+1]
+
+    def expect(self, characters):
+        character = self.peek()
+        if character == '' or character not in characters:
+            raise ValueError(f"Expected one of {characters!r} at {character!r} in the TRC_data response")
+        self.pos += 1
+        return character
+
+    # Decodes the next JSON value, reading more text until the value is complete
+    def decode(self):
+        self.peek()
+        while True:
+            try:
+                value, end = decoder.raw_decode(self.buffer, self.pos)
+                # A number at the very end of the text read so far may still be cut off
+                if end < len(self.buffer) or self.eof:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self.read()
+
+# Decodes the whole response into a dict, the same as json.load but straight from the response bytes.
+# The whole text is decoded at once with json_loader, so the fastest installed JSON decoder is used.
+def load_response(source, non_ascii='keep', chunk_size=65536):
+    reader = _Reader(source, chunk_size, non_ascii)
+    while reader.read():
+        pass
+    return json_loader.loads(reader.buffer)
+
+# Yields each element of the TRC_data array, i.e. {'citation': {...}, 'systems': [...]}, one at a time.
+# The other top level keys (i.e. number_of_citations) are skipped.
+def iter_citations(source, non_ascii='keep', chunk_size=65536):
+    reader = _Reader(source, chunk_size, non_ascii)
+    reader.expect('{')
+    if reader.peek() == '}':
+        return
+    while True:
+        key = reader.decode()
+        reader.expect(':')
+        if key == 'TRC_data':
+            reader.expect('[')
+            if reader.peek() == ']':
+                reader.pos += 1
+            else:
+                while True:
+                    yield reader.decode()
+                    if reader.expect(',]') == ']':
+                        break
+        else:
+            reader.decode()
+        if reader.expect(',}') == '}':
+            return
+
+# Yields a (citation, system, data_set) tuple for every data set in the response, where citation is the
+# citation object of the paper (i.e. citation['year']) and system is the system the data set belongs to.
+def iter_data_sets(source, non_ascii='keep', chunk_size=65536):
+    for a in iter_citations(source, non_ascii, chunk_size):
+        for b in a.get('systems', []):
+            for c in b.get('data_sets', []):
+                yield (a['citation'], b, c)